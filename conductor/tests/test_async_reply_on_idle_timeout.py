@@ -78,9 +78,9 @@ def test_wait_timeout_still_running_signals_third_tuple():
             1, stderr="timeout waiting for completion: agent still running after 5m0s"
         ),
     ):
-        ok, response, still_running = send_to_conductor(
+        ok, response, still_running = _run(send_to_conductor(
             "conductor-ops", "hi", profile="work", wait_for_reply=True,
-        )
+        ))
     assert ok is False
     assert response == ""
     assert still_running is True
@@ -90,9 +90,9 @@ def test_wait_genuine_failure_is_not_still_running():
     with mock.patch(
         "bridge.run_cli", return_value=_completed(1, stderr="session not found"),
     ):
-        ok, response, still_running = send_to_conductor(
+        ok, response, still_running = _run(send_to_conductor(
             "conductor-ops", "hi", profile="work", wait_for_reply=True,
-        )
+        ))
     assert ok is False
     assert still_running is False
 
@@ -101,9 +101,9 @@ def test_wait_success_returns_output():
     with mock.patch(
         "bridge.run_cli", return_value=_completed(0, stdout="the answer\n"),
     ):
-        ok, response, still_running = send_to_conductor(
+        ok, response, still_running = _run(send_to_conductor(
             "conductor-ops", "hi", profile="work", wait_for_reply=True,
-        )
+        ))
     assert (ok, response, still_running) == (True, "the answer", False)
 
 
@@ -164,6 +164,43 @@ def test_watcher_empty_output_uses_placeholder():
     assert delivered == ["[No output from conductor.]"]
 
 
+def test_watcher_delivers_only_the_unstreamed_remainder():
+    delivered: list[str] = []
+
+    async def cb(text: str) -> None:
+        delivered.append(text)
+
+    with mock.patch(
+        "bridge.get_session_status", return_value="waiting",
+    ), mock.patch(
+        "bridge.get_session_output", return_value="Looking into it.\nAll green.",
+    ):
+        _run(_watch_pending_reply(
+            "conductor-ops", "work", cb, already_sent="Looking into it.",
+        ))
+
+    assert delivered == ["All green."]
+
+
+def test_watcher_skips_a_reply_that_was_streamed_in_full():
+    delivered: list[str] = []
+
+    async def cb(text: str) -> None:
+        delivered.append(text)
+
+    with mock.patch(
+        "bridge.get_session_status", return_value="waiting",
+    ), mock.patch(
+        "bridge.get_session_output", return_value="All green.",
+    ):
+        _run(_watch_pending_reply(
+            "conductor-ops", "work", cb,
+            already_sent="Looking into it.\nAll green.",
+        ))
+
+    assert delivered == []
+
+
 def test_watcher_gives_up_after_ceiling_and_notifies():
     delivered: list[str] = []
 
@@ -220,3 +257,19 @@ def test_register_pending_reply_no_event_loop_is_safe():
 
     # No running loop here -> must not raise.
     _register_pending_reply("conductor-ops", "work", cb)
+
+
+# --- send_to_conductor non-wait path ---------------------------------------
+
+def test_non_wait_send_queues_without_a_cli_call():
+    # Keep the background drain out of it: this only checks the enqueue.
+    with mock.patch("bridge.run_cli") as run_cli, mock.patch(
+        "bridge._ensure_drain_task",
+    ) as ensure_drain, mock.patch.dict(bridge._message_queue, clear=True):
+        result = _run(send_to_conductor("conductor-ops", "hi", profile="work"))
+        queued = list(bridge._message_queue["conductor-ops"])
+
+    assert result == (True, "", False)
+    assert queued == [("hi", "work", None)]
+    ensure_drain.assert_called_once()
+    run_cli.assert_not_called()
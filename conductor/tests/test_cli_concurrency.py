@@ -0,0 +1,92 @@
+"""Tests for the bound on concurrently running agent-deck CLI processes.
+
+Every run_cli call used to spawn its child immediately, so a burst of
+messages, slash commands and heartbeat work could fork dozens of CLIs at
+once. Spawns now wait for one of MAX_CONCURRENT_CLI slots; conductor sends
+that block on a reply draw from a separate MAX_CONCURRENT_SENDS pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+from bridge import run_cli  # noqa: E402
+
+
+def test_concurrent_cli_processes_are_capped():
+    in_flight = 0
+    peak = 0
+
+    class FakeProc:
+        returncode = 0
+        pid = 0
+
+        async def communicate(self):
+            nonlocal in_flight
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return b"{}", b""
+
+    async def fake_exec(*_cmd, **_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        return FakeProc()
+
+    async def driver() -> list:
+        return await asyncio.gather(*(run_cli("status", "--json") for _ in range(7)))
+
+    with mock.patch("bridge.MAX_CONCURRENT_CLI", 3), mock.patch(
+        "bridge.asyncio.create_subprocess_exec", side_effect=fake_exec,
+    ), mock.patch("bridge._cli_command", lambda args, profile: ["agent-deck", *args]):
+        results = asyncio.run(driver())
+
+    assert peak == 3
+    assert [r.stdout for r in results] == ["{}"] * 7
+
+
+def test_long_running_sends_do_not_starve_quick_calls():
+    release = {}
+
+    class FakeProc:
+        returncode = 0
+        pid = 0
+
+        def __init__(self, cmd):
+            self.cmd = cmd
+
+        async def communicate(self):
+            if "--wait" in self.cmd:
+                await release.setdefault("send", asyncio.Event()).wait()
+            return b"{}", b""
+
+    async def fake_exec(*cmd, **_kwargs):
+        return FakeProc(cmd)
+
+    async def driver() -> str:
+        send = asyncio.ensure_future(
+            run_cli("session", "send", "c", "hi", "--wait", long_running=True)
+        )
+        await asyncio.sleep(0)
+        # The only general slot is free even though a send is in flight.
+        status = await asyncio.wait_for(run_cli("status", "--json"), timeout=1)
+        release.setdefault("send", asyncio.Event()).set()
+        await send
+        return status.stdout
+
+    with mock.patch("bridge.MAX_CONCURRENT_CLI", 1), mock.patch(
+        "bridge.MAX_CONCURRENT_SENDS", 1,
+    ), mock.patch(
+        "bridge.asyncio.create_subprocess_exec", side_effect=fake_exec,
+    ), mock.patch("bridge._cli_command", lambda args, profile: ["agent-deck", *args]):
+        assert asyncio.run(driver()) == "{}"
@@ -0,0 +1,125 @@
+"""Tests for the per-conductor job queues used by the platform handlers.
+
+Handlers used to run `session send --wait` inline, so two messages for the
+same conductor could race into its pane and nothing bounded the backlog.
+They now submit the work to a per-conductor worker: jobs for one conductor
+run in order, different conductors run in parallel, and a full queue
+refuses new work.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+import bridge  # noqa: E402
+from bridge import CONDUCTOR_JOB_QUEUE_SIZE, _submit_conductor_job  # noqa: E402
+
+
+async def _wait_idle() -> None:
+    while bridge._conductor_workers:
+        await asyncio.gather(*bridge._conductor_workers.values())
+
+
+def test_jobs_for_one_conductor_run_in_order():
+    events: list[str] = []
+
+    def job(tag: str):
+        async def run() -> None:
+            events.append(f"start {tag}")
+            await asyncio.sleep(0.01)
+            events.append(f"end {tag}")
+        return run
+
+    async def driver() -> list:
+        aheads = [
+            _submit_conductor_job("conductor-ops", "work", job(tag))
+            for tag in ("a", "b", "c")
+        ]
+        await _wait_idle()
+        return aheads
+
+    aheads = asyncio.run(driver())
+
+    assert aheads == [0, 1, 2]
+    assert events == [
+        "start a", "end a", "start b", "end b", "start c", "end c",
+    ]
+    assert not bridge._conductor_jobs
+
+
+def test_different_conductors_run_concurrently():
+    in_flight = 0
+    peak = 0
+
+    async def job() -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    async def driver() -> None:
+        _submit_conductor_job("conductor-ops", "work", job)
+        _submit_conductor_job("conductor-home", "home", job)
+        await _wait_idle()
+
+    asyncio.run(driver())
+    assert peak == 2
+
+
+def test_full_queue_refuses_and_failed_job_does_not_stop_worker():
+    ran: list[int] = []
+
+    def job(i: int):
+        async def run() -> None:
+            ran.append(i)
+            if i == 0:
+                raise RuntimeError("boom")
+        return run
+
+    async def driver() -> list:
+        results = [
+            _submit_conductor_job("conductor-ops", "work", job(i))
+            for i in range(CONDUCTOR_JOB_QUEUE_SIZE + 1)
+        ]
+        await _wait_idle()
+        return results
+
+    results = asyncio.run(driver())
+
+    assert results[-1] is None
+    assert ran == list(range(CONDUCTOR_JOB_QUEUE_SIZE))
+
+
+def test_cancelled_worker_is_replaced_on_next_submit():
+    ran: list[str] = []
+
+    async def stuck() -> None:
+        await asyncio.sleep(3600)
+
+    async def job() -> None:
+        ran.append("next")
+
+    async def driver() -> None:
+        _submit_conductor_job("conductor-ops", "work", stuck)
+        worker = bridge._conductor_workers[("work", "conductor-ops")]
+        await asyncio.sleep(0)
+        worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await worker
+        assert _submit_conductor_job("conductor-ops", "work", job) == 0
+        await _wait_idle()
+
+    asyncio.run(driver())
+    assert ran == ["next"]
+    assert not bridge._conductor_workers
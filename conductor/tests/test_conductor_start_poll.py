@@ -0,0 +1,48 @@
+"""Tests for the post-start readiness poll in ensure_conductor_running.
+
+After `session start` the bridge used to sleep a fixed 5s and then check the
+status once. It now polls every CONDUCTOR_START_POLL_INTERVAL seconds and
+returns as soon as the conductor reports a ready status.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+from bridge import CONDUCTOR_START_POLLS, _wait_for_conductor_start  # noqa: E402
+
+
+def _poll(statuses):
+    sleep = mock.AsyncMock()
+    with mock.patch("bridge.asyncio.sleep", new=sleep), mock.patch(
+        "bridge.get_session_status", side_effect=statuses,
+    ) as status:
+        result = asyncio.run(_wait_for_conductor_start("conductor-ops", "work"))
+    return result, status.call_count, sleep.await_count
+
+
+def test_returns_on_first_ready_status_without_sleeping():
+    assert _poll(["idle"]) == (True, 1, 0)
+
+
+def test_keeps_polling_through_starting_and_transient_failures():
+    assert _poll(["starting", "unknown", "error", "waiting"]) == (True, 4, 3)
+
+
+def test_gives_up_after_the_poll_budget():
+    result, polls, sleeps = _poll(["error"] * CONDUCTOR_START_POLLS)
+    assert (result, polls, sleeps) == (False, CONDUCTOR_START_POLLS, CONDUCTOR_START_POLLS - 1)
+
+
+def test_still_starting_at_the_end_counts_as_started():
+    assert _poll(["starting"] * CONDUCTOR_START_POLLS)[0] is True
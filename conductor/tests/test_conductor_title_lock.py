@@ -185,18 +185,18 @@ def test_verified_empty_profile_allows_first_conductor_creation():
     empty = _completed(0)
     empty.stdout = "No sessions found in profile 'default'.\n"
     with mock.patch("bridge.run_cli", return_value=empty):
-        assert get_sessions_list("default", fail_closed=True) == []
+        assert asyncio.run(get_sessions_list("default", fail_closed=True)) == []
 
 
 def test_malformed_list_json_fails_closed():
     malformed = _completed(0)
     malformed.stdout = "unexpected output"
     with mock.patch("bridge.run_cli", return_value=malformed):
-        assert get_sessions_list("default", fail_closed=True) is None
+        assert asyncio.run(get_sessions_list("default", fail_closed=True)) is None
 
 
 def test_malformed_list_json_schema_fails_closed():
     malformed = _completed(0)
     malformed.stdout = '{"sessions": "not-a-list"}'
     with mock.patch("bridge.run_cli", return_value=malformed):
-        assert get_sessions_list("default", fail_closed=True) is None
+        assert asyncio.run(get_sessions_list("default", fail_closed=True)) is None
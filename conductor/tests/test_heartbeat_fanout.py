@@ -0,0 +1,102 @@
+"""Tests for the per-conductor heartbeat fan-out in heartbeat_loop.
+
+Each tick used to heartbeat conductors one after another, so a conductor
+taking the full RESPONSE_TIMEOUT to answer delayed every conductor behind
+it. Conductors are now heartbeated concurrently and isolated from each
+other's failures, and their NEED: alerts go out as one notification per tick.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+import bridge  # noqa: E402
+
+CONDUCTORS = [
+    {"name": "slow", "profile": "work"},
+    {"name": "fast", "profile": "work"},
+    {"name": "broken", "profile": "work"},
+]
+SESSIONS = [
+    {"title": t, "group": g, "status": "waiting", "path": "/p"}
+    for t, g in (("a", "slow"), ("b", "fast"), ("c", "broken"))
+]
+CONFIG = {"heartbeat_interval": 1, "telegram": {"configured": False}}
+
+
+def _run_one_tick(send_to_conductor, **loop_kwargs) -> None:
+    sleeps = 0
+
+    async def fake_sleep(_seconds):
+        nonlocal sleeps
+        sleeps += 1
+        if sleeps > 1:
+            raise asyncio.CancelledError
+
+    async def driver():
+        try:
+            await bridge.heartbeat_loop(CONFIG, **loop_kwargs)
+        except asyncio.CancelledError:
+            pass
+
+    with mock.patch("bridge.asyncio.sleep", new=fake_sleep), mock.patch(
+        "bridge._os_heartbeat_daemon_installed", return_value=False,
+    ), mock.patch("bridge.discover_conductors", return_value=CONDUCTORS), mock.patch(
+        "bridge.select_heartbeat_conductors", side_effect=lambda cs: cs,
+    ), mock.patch(
+        "bridge.get_sessions_by_profile", return_value={"work": SESSIONS},
+    ), mock.patch("bridge.ensure_conductor_running", return_value=True), mock.patch(
+        "bridge.get_session_status", return_value="idle",
+    ), mock.patch("bridge.invoke_hook", return_value=None), mock.patch(
+        "bridge.send_to_conductor", side_effect=send_to_conductor,
+    ):
+        asyncio.run(asyncio.wait_for(driver(), timeout=5))
+
+
+def test_slow_conductor_does_not_block_the_others():
+    events: dict[str, asyncio.Event] = {}
+    answered = []
+
+    async def send(session, _msg, **_kwargs):
+        # Created on first use so it binds to the running loop (Python 3.8).
+        fast_done = events.setdefault("fast", asyncio.Event())
+        if session == "conductor-broken":
+            raise RuntimeError("boom")
+        if session == "conductor-slow":
+            # Only completes if "fast" is heartbeated while "slow" is pending.
+            await fast_done.wait()
+        answered.append(session)
+        if session == "conductor-fast":
+            fast_done.set()
+        return True, "all good", False
+
+    _run_one_tick(send)
+
+    assert answered == ["conductor-fast", "conductor-slow"]
+
+
+def test_alerts_from_one_tick_are_sent_together():
+    slack_app = mock.MagicMock()
+    slack_app.client.chat_postMessage = mock.AsyncMock()
+
+    async def send(session, _msg, **_kwargs):
+        if session == "conductor-broken":
+            return True, "all good", False
+        return True, f"NEED: look at {session}", False
+
+    _run_one_tick(send, slack_app=slack_app, slack_channel_id="C1")
+
+    slack_app.client.chat_postMessage.assert_awaited_once()
+    text = slack_app.client.chat_postMessage.await_args.kwargs["text"]
+    assert "[slow] Conductor alert:\nNEED: look at conductor-slow" in text
+    assert "[fast] Conductor alert:\nNEED: look at conductor-fast" in text
@@ -0,0 +1,65 @@
+"""Tests for load_config's TOML parsing.
+
+The bridge parses config.toml with stdlib tomllib on Python 3.11+ (tomli on
+older interpreters), which reads the file in binary mode; the pure-Python
+toml package is only a last-resort fallback.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+import bridge  # noqa: E402
+
+CONFIG = """
+[conductor]
+heartbeat_interval = 30
+
+[conductor.telegram]
+token = "123:abc"
+user_id = 42
+
+[conductor.slack]
+bot_token = "xoxb-1"
+app_token = "xapp-1"
+channel_id = "C1"
+allowed_user_ids = ["U1", "U2"]
+"""
+
+
+def test_load_config_parses_toml(tmp_path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(CONFIG)
+
+    with mock.patch.object(bridge, "CONFIG_PATH", config_path), mock.patch(
+        "bridge.discover_conductors", return_value=[{"name": "ops"}],
+    ):
+        cfg = bridge.load_config()
+
+    assert cfg["telegram"] == {"token": "123:abc", "user_id": 42, "configured": True}
+    assert cfg["slack"]["configured"] is True
+    assert cfg["slack"]["allowed_user_ids"] == ["U1", "U2"]
+    assert cfg["slack"]["default_role"] == "user"
+    assert cfg["heartbeat_interval"] == 30
+
+
+def test_max_concurrent_cli_defaults_and_overrides(tmp_path):
+    config_path = tmp_path / "config.toml"
+    with mock.patch.object(bridge, "CONFIG_PATH", config_path), mock.patch(
+        "bridge.discover_conductors", return_value=[{"name": "ops"}],
+    ):
+        config_path.write_text(CONFIG)
+        assert bridge.load_config()["max_concurrent_cli"] == bridge.MAX_CONCURRENT_CLI
+        config_path.write_text(CONFIG.replace(
+            "heartbeat_interval = 30", "heartbeat_interval = 30\nmax_concurrent_cli = 4",
+        ))
+        assert bridge.load_config()["max_concurrent_cli"] == 4
@@ -0,0 +1,37 @@
+"""Tests for conductor-prefix routing (parse_conductor_prefix)."""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+from bridge import parse_conductor_prefix  # noqa: E402
+
+NAMES = ["home", "ops", "ops-eu"]
+
+
+def test_prefixed_message_routes_and_strips():
+    assert parse_conductor_prefix("ops: deploy  ", NAMES) == ("ops", "deploy")
+    assert parse_conductor_prefix("ops-eu:status", NAMES) == ("ops-eu", "status")
+
+
+def test_unprefixed_message_is_returned_untouched():
+    assert parse_conductor_prefix("  hello: there", NAMES) == (None, "  hello: there")
+    assert parse_conductor_prefix("opsx: hi", NAMES) == (None, "opsx: hi")
+    assert parse_conductor_prefix("ops deploy", NAMES) == (None, "ops deploy")
+
+
+def test_no_conductors():
+    assert parse_conductor_prefix("ops: hi", []) == (None, "ops: hi")
+
+
+def test_name_set_changes_are_picked_up():
+    assert parse_conductor_prefix("new: hi", NAMES) == (None, "new: hi")
+    assert parse_conductor_prefix("new: hi", NAMES + ["new"]) == ("new", "hi")
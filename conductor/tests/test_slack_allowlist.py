@@ -0,0 +1,50 @@
+"""Tests for the Slack allowlist built at startup.
+
+allowed_user_ids comes straight from config.toml, so operator typos
+(stray whitespace, duplicates, blank entries) are normalized once when the
+Slack app is created instead of being tolerated on every event. Each
+allowed user maps to a policy dict for role checks.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+from bridge import _build_slack_allowlist, _slack_user_policy  # noqa: E402
+
+
+def test_allowlist_strips_whitespace():
+    assert _build_slack_allowlist([" U12345", "U67890 \n"]).keys() == {"U12345", "U67890"}
+
+
+def test_allowlist_dedupes():
+    assert _build_slack_allowlist(["U12345", "U12345 ", "U12345"]).keys() == {"U12345"}
+
+
+def test_allowlist_drops_empty():
+    assert _build_slack_allowlist(["", "   ", "U12345"]).keys() == {"U12345"}
+    assert _build_slack_allowlist(None) == {}
+
+
+def test_allowlist_is_interned():
+    raw = "".join(("U123", "45 "))
+    (entry,) = _build_slack_allowlist([raw])
+    assert entry is sys.intern("U12345")
+
+
+def test_allowlist_keeps_case():
+    assert "U12345" not in _build_slack_allowlist(["u12345"])
+
+
+def test_policy_lookup():
+    allowlist = _build_slack_allowlist(["U12345"], default_role="admin")
+    assert _slack_user_policy(allowlist, "U12345") == {"role": "admin"}
+    assert _slack_user_policy(allowlist, "U99999") is None
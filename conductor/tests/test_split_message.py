@@ -0,0 +1,72 @@
+"""Tests for split_message.
+
+split_message used to re-slice the remaining text after every chunk, which
+is quadratic in the reply length. It now walks a single index forward; these
+tests pin that the chunks are exactly what the old slicing loop produced.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+from bridge import TG_MAX_LENGTH, split_message  # noqa: E402
+
+
+def _reference_split(text: str, max_len: int) -> list[str]:
+    """The original slicing implementation."""
+    if len(text) <= max_len:
+        return [text]
+    chunks = []
+    while text:
+        if len(text) <= max_len:
+            chunks.append(text)
+            break
+        split_at = text.rfind("\n", 0, max_len)
+        if split_at == -1:
+            split_at = max_len
+        chunks.append(text[:split_at])
+        text = text[split_at:].lstrip("\n")
+    return chunks
+
+
+def test_short_text_is_one_chunk():
+    assert split_message("hello") == ["hello"]
+    assert split_message("") == [""]
+
+
+def test_splits_on_last_newline_within_limit():
+    assert split_message("aaaa\nbbbb\ncc", max_len=10) == ["aaaa\nbbbb", "cc"]
+
+
+def test_hard_split_without_newlines():
+    assert split_message("x" * 25, max_len=10) == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_newline_runs_at_the_cut_are_dropped():
+    assert split_message("aaaaaaa\n\n\nbb", max_len=8) == ["aaaaaaa", "bb"]
+
+
+def test_every_chunk_fits_the_limit():
+    text = ("word " * 50 + "\n") * 400
+    chunks = split_message(text)
+    assert all(len(c) <= TG_MAX_LENGTH for c in chunks)
+
+
+def test_matches_original_behaviour_on_random_text():
+    rng = random.Random(1234)
+    alphabet = "ab \n"
+    for _ in range(300):
+        max_len = rng.randint(1, 12)
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+        assert split_message(text, max_len=max_len) == _reference_split(text, max_len), (
+            text, max_len,
+        )
@@ -0,0 +1,110 @@
+"""Tests for the short-lived session status cache.
+
+ensure_conductor_running used to spawn `agent-deck session show --json` on
+every message and every heartbeat tick just to learn the conductor is still
+up. get_session_status now remembers the last observed status per
+(profile, session) and liveness checks may reuse a healthy one for
+STATUS_TTL seconds. Busy checks stay fresh, and failures invalidate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import subprocess
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+import bridge  # noqa: E402
+from bridge import (  # noqa: E402
+    STATUS_TTL,
+    _invalidate_session_status,
+    get_session_status,
+)
+
+
+def _show(status: str) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(
+        ["agent-deck"], 0, json.dumps({"status": status}), ""
+    )
+
+
+def _status(*args, **kwargs) -> str:
+    return asyncio.run(get_session_status(*args, **kwargs))
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    bridge._status_cache.clear()
+    yield
+    bridge._status_cache.clear()
+
+
+def test_fresh_status_reused_within_ttl():
+    with mock.patch("bridge.run_cli", return_value=_show("idle")) as cli:
+        assert _status("conductor-ops", "work") == "idle"
+        assert _status("conductor-ops", "work", max_age=STATUS_TTL) == "idle"
+    cli.assert_called_once()
+
+
+def test_default_call_always_queries_cli():
+    with mock.patch("bridge.run_cli", return_value=_show("idle")) as cli:
+        _status("conductor-ops", "work")
+        _status("conductor-ops", "work")
+    assert cli.call_count == 2
+
+
+def test_expired_entry_is_refetched():
+    with mock.patch("bridge.run_cli", return_value=_show("idle")) as cli:
+        _status("conductor-ops", "work")
+        key = ("work", "conductor-ops")
+        observed_at, status = bridge._status_cache[key]
+        bridge._status_cache[key] = (observed_at - STATUS_TTL - 1, status)
+        _status("conductor-ops", "work", max_age=STATUS_TTL)
+    assert cli.call_count == 2
+
+
+def test_error_status_is_never_served_from_cache():
+    with mock.patch(
+        "bridge.run_cli", side_effect=[_show("error"), _show("idle")]
+    ) as cli:
+        assert _status("conductor-ops", "work") == "error"
+        assert _status("conductor-ops", "work", max_age=STATUS_TTL) == "idle"
+    assert cli.call_count == 2
+
+
+def test_cache_is_scoped_per_profile():
+    with mock.patch(
+        "bridge.run_cli", side_effect=[_show("idle"), _show("running")]
+    ) as cli:
+        _status("conductor-ops", "work")
+        assert _status("conductor-ops", "home", max_age=STATUS_TTL) == "running"
+    assert cli.call_count == 2
+
+
+def test_invalidate_forces_requery():
+    with mock.patch("bridge.run_cli", return_value=_show("idle")) as cli:
+        _status("conductor-ops", "work")
+        _invalidate_session_status("conductor-ops", "work")
+        _status("conductor-ops", "work", max_age=STATUS_TTL)
+    assert cli.call_count == 2
+
+
+def test_failed_send_invalidates_cached_status():
+    bridge._status_cache[("work", "conductor-ops")] = (0.0, "idle")
+    failed = subprocess.CompletedProcess(["agent-deck"], 1, "", "session not found")
+    with mock.patch("bridge.run_cli", return_value=failed):
+        asyncio.run(bridge.send_to_conductor(
+            "conductor-ops", "hi", profile="work", wait_for_reply=True,
+        ))
+    assert ("work", "conductor-ops") not in bridge._status_cache
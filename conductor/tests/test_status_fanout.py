@@ -0,0 +1,104 @@
+"""Tests for the concurrent per-profile status/session fan-out.
+
+get_status_summary_all and get_sessions_list_all used to call the CLI once per
+profile in sequence, so /status and /sessions cost N CLI round trips. They now
+launch every profile's CLI call at once and await them together; these tests
+pin the aggregation result and that the calls really overlap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import subprocess
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+from bridge import (  # noqa: E402
+    get_sessions_by_profile,
+    get_sessions_list_all,
+    get_status_summary_all,
+)
+
+
+def _completed(returncode: int = 0, stdout: str = "", stderr: str = ""):
+    return subprocess.CompletedProcess(["agent-deck"], returncode, stdout, stderr)
+
+
+def test_status_summary_all_aggregates_per_profile():
+    by_profile = {
+        "work": _completed(stdout=json.dumps(
+            {"waiting": 1, "running": 2, "idle": 0, "error": 0, "stopped": 1, "total": 4}
+        )),
+        "home": _completed(stdout=json.dumps(
+            {"waiting": 0, "running": 1, "idle": 3, "error": 1, "stopped": 0, "total": 5}
+        )),
+        "broken": _completed(1, stderr="boom"),
+    }
+
+    async def fake_cli(*_args, profile=None, timeout=120):
+        return by_profile[profile]
+
+    with mock.patch("bridge.run_cli", side_effect=fake_cli):
+        agg = asyncio.run(get_status_summary_all(["work", "home", "broken"]))
+
+    assert agg["totals"] == {
+        "waiting": 1, "running": 3, "idle": 3, "error": 1, "stopped": 1, "total": 9,
+    }
+    assert list(agg["per_profile"]) == ["work", "home", "broken"]
+    assert agg["per_profile"]["broken"]["total"] == 0
+
+
+def test_profiles_are_queried_concurrently():
+    in_flight = 0
+    peak = 0
+
+    async def fake_cli(*_args, profile=None, timeout=120):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _completed(stdout=json.dumps({"sessions": [{"title": profile}]}))
+
+    with mock.patch("bridge.run_cli", side_effect=fake_cli):
+        sessions = asyncio.run(get_sessions_list_all(["a", "b", "c"]))
+
+    assert peak == 3
+    assert sessions == [
+        ("a", {"title": "a"}), ("b", {"title": "b"}), ("c", {"title": "c"}),
+    ]
+
+
+def test_sessions_by_profile_one_call_per_profile_failures_empty():
+    by_profile = {
+        "work": _completed(stdout=json.dumps({"sessions": [{"title": "w1"}]})),
+        "home": _completed(1, stderr="boom"),
+    }
+    calls = []
+
+    async def fake_cli(*args, profile=None, timeout=120):
+        calls.append((args, profile))
+        return by_profile[profile]
+
+    with mock.patch("bridge.run_cli", side_effect=fake_cli):
+        result = asyncio.run(get_sessions_by_profile(["work", "home"]))
+
+    assert result == {"work": [{"title": "w1"}], "home": []}
+    assert calls == [(("list", "--json"), "work"), (("list", "--json"), "home")]
+
+
+def test_totals_keep_every_key_without_profiles():
+    agg = asyncio.run(get_status_summary_all([]))
+    assert agg == {
+        "totals": {"waiting": 0, "running": 0, "idle": 0, "error": 0, "stopped": 0, "total": 0},
+        "per_profile": {},
+    }
@@ -0,0 +1,160 @@
+"""Tests for streaming conductor replies via `session send --stream`.
+
+The idle Telegram path used to block on `--wait` and post the whole reply at
+the end of the turn. For Claude conductors it now reads the CLI's JSONL event
+stream and forwards text as it arrives. These tests drive the parser with a
+stand-in child process that prints a canned event stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import signal
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+import bridge  # noqa: E402
+from bridge import (  # noqa: E402
+    STREAM_FLUSH_CHARS,
+    conductor_agent,
+    send_to_conductor_streaming,
+)
+
+
+def _fake_cli(events: list[dict], exit_code: int = 0, stderr: str = ""):
+    """Return a _cli_command stand-in that runs a child printing events."""
+    script = (
+        "import sys\n"
+        f"for line in {[json.dumps(e) for e in events]!r}:\n"
+        "    print(line, flush=True)\n"
+        f"sys.stderr.write({stderr!r})\n"
+        f"sys.exit({exit_code})\n"
+    )
+    return lambda _args, _profile: [sys.executable, "-c", script]
+
+
+def _stream(events, exit_code=0, stderr=""):
+    chunks: list[str] = []
+
+    async def on_chunk(text: str) -> None:
+        chunks.append(text)
+
+    with mock.patch("bridge._cli_command", _fake_cli(events, exit_code, stderr)):
+        result = asyncio.run(
+            send_to_conductor_streaming("conductor-ops", "hi", on_chunk, profile="work")
+        )
+    return result, chunks
+
+
+def test_text_is_forwarded_at_tool_calls_and_end_of_turn():
+    result, chunks = _stream([
+        {"type": "start", "schema_version": "1"},
+        {"type": "text", "delta": "Looking into it."},
+        {"type": "tool_use", "name": "Bash"},
+        {"type": "tool_result"},
+        {"type": "text", "delta": "All green."},
+        {"type": "stop", "reason": "end_turn"},
+    ])
+    assert result == (True, "Looking into it.\nAll green.", False)
+    assert chunks == ["Looking into it.", "All green."]
+
+
+def test_long_text_is_flushed_in_bounded_chunks_on_line_breaks():
+    line = "x" * 99 + "\n"
+    body = line * (2 * STREAM_FLUSH_CHARS // len(line) + 3)
+    (ok, response, _), chunks = _stream([
+        {"type": "start"},
+        {"type": "text", "delta": body},
+        {"type": "stop"},
+    ])
+    assert ok and response == body.strip()
+    assert len(chunks) == 3
+    assert all(len(c) <= STREAM_FLUSH_CHARS for c in chunks)
+    assert "\n".join(chunks) == body.strip()
+
+
+def test_non_object_lines_are_skipped():
+    result, chunks = _stream([
+        {"type": "start"},
+        7,
+        "text",
+        ["stop"],
+        {"type": "text", "delta": "done"},
+        {"type": "stop"},
+    ])
+    assert result == (True, "done", False)
+    assert chunks == ["done"]
+
+
+def test_error_after_start_reports_still_running():
+    result, chunks = _stream(
+        [
+            {"type": "start"},
+            {"type": "text", "delta": "partial"},
+            {"type": "error", "message": "stream idle timeout"},
+        ],
+        exit_code=1,
+    )
+    assert result == (False, "partial", True)
+    assert chunks == ["partial"]
+
+
+def test_failure_before_any_event_is_a_plain_failure():
+    bridge._status_cache[("work", "conductor-ops")] = (0.0, "idle")
+    result, chunks = _stream([], exit_code=2, stderr="session not found")
+    assert result == (False, "", False)
+    assert chunks == []
+    assert ("work", "conductor-ops") not in bridge._status_cache
+
+
+def test_cancelled_stream_kills_the_child_and_stderr_reader():
+    script = (
+        "import time\n"
+        "print('{\"type\": \"start\"}', flush=True)\n"
+        "time.sleep(60)\n"
+    )
+    procs: list = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def spawn(*args, **kwargs):
+        proc = await real_exec(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    async def on_chunk(_text: str) -> None:
+        pass
+
+    async def driver() -> list:
+        task = asyncio.ensure_future(
+            send_to_conductor_streaming("conductor-ops", "hi", on_chunk)
+        )
+        while not procs:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        return [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+    with mock.patch("bridge._cli_command", lambda _a, _p: [sys.executable, "-c", script]), \
+            mock.patch("bridge.asyncio.create_subprocess_exec", spawn):
+        leftover = asyncio.run(driver())
+
+    assert procs[0].returncode == -signal.SIGKILL
+    assert leftover == []
+
+
+def test_conductor_agent_defaults_to_claude():
+    assert conductor_agent({"name": "ops"}) == "claude"
+    assert conductor_agent({"name": "ops", "agent": ""}) == "claude"
+    assert conductor_agent({"name": "ops", "agent": "Codex"}) == "codex"
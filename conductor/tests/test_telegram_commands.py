@@ -0,0 +1,44 @@
+"""Tests for the single Telegram command pattern (TG_COMMAND_RE).
+
+The bot used to register one aiogram Command filter per slash command; every
+message was tried against each in turn. One compiled pattern now recognises
+all of them and a dict dispatches on the captured verb.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+from bridge import TG_COMMAND_RE  # noqa: E402
+
+
+def _match(text: str):
+    m = TG_COMMAND_RE.match(text)
+    return m.groups() if m else None
+
+
+def test_known_commands_with_and_without_arguments():
+    assert _match("/status") == ("status", None)
+    assert _match("/start") == ("start", None)
+    assert _match("/restart ops") == ("restart", None)
+    assert _match("/sessions\nplease") == ("sessions", None)
+
+
+def test_bot_mention_is_captured():
+    assert _match("/help@ConductorBot") == ("help", "ConductorBot")
+    assert _match("/restart@ConductorBot ops") == ("restart", "ConductorBot")
+
+
+def test_non_commands_fall_through_to_the_conductor():
+    assert _match("/statusreport") is None
+    assert _match("/deploy") is None
+    assert _match("please /status") is None
+    assert _match("ops: /status") is None
@@ -0,0 +1,131 @@
+"""Tests for the paced, coalescing Telegram sender.
+
+Long conductor replies and heartbeat alerts used to go out as back-to-back
+send_message calls with no pacing, which trips Telegram's bot-wide rate
+limit. TelegramSender queues outbound texts, merges consecutive ones for the
+same chat when they fit in one message, and spaces API calls out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import toml  # noqa: F401
+except ModuleNotFoundError:
+    sys.modules["toml"] = types.SimpleNamespace(load=lambda *_a, **_k: {})
+
+import bridge  # noqa: E402
+from bridge import (  # noqa: E402
+    TG_MAX_LENGTH,
+    TG_MAX_MESSAGES_PER_SEC,
+    TelegramSender,
+    _keep_typing,
+    get_telegram_sender,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_senders():
+    yield
+    bridge._telegram_senders.clear()
+
+
+class FakeBot:
+    def __init__(self, fail: bool = False):
+        self.sent: list[tuple] = []
+        self.times: list[float] = []
+        self.actions: list[tuple] = []
+        self.fail = fail
+
+    async def send_message(self, chat_id, text, parse_mode=None, message_thread_id=None):
+        self.times.append(time.monotonic())
+        if self.fail:
+            raise RuntimeError("429 Too Many Requests")
+        self.sent.append((chat_id, text, parse_mode, message_thread_id))
+
+    async def send_chat_action(self, chat_id, action, message_thread_id=None):
+        self.actions.append((chat_id, action, message_thread_id))
+
+
+def test_consecutive_texts_for_one_chat_are_merged():
+    bot = FakeBot()
+    sender = TelegramSender(bot)
+
+    async def driver() -> None:
+        await asyncio.gather(
+            sender.send(1, "a", parse_mode="HTML"),
+            sender.send(1, "b", parse_mode="HTML"),
+            sender.send(2, "c", parse_mode="HTML"),
+            sender.send(1, "d"),
+        )
+
+    asyncio.run(driver())
+    assert bot.sent == [
+        (1, "a\nb", "HTML", None),
+        (2, "c", "HTML", None),
+        (1, "d", None, None),
+    ]
+
+
+def test_texts_that_do_not_fit_together_stay_separate():
+    bot = FakeBot()
+    sender = TelegramSender(bot)
+    big = "x" * (TG_MAX_LENGTH - 10)
+
+    async def driver() -> None:
+        await asyncio.gather(sender.send(1, big), sender.send(1, "y" * 20))
+
+    asyncio.run(driver())
+    assert [len(text) for _, text, _, _ in bot.sent] == [TG_MAX_LENGTH - 10, 20]
+
+
+def test_sends_are_paced():
+    bot = FakeBot()
+    sender = TelegramSender(bot)
+
+    async def driver() -> None:
+        await asyncio.gather(*(sender.send(chat, "hi") for chat in range(4)))
+
+    asyncio.run(driver())
+    gaps = [b - a for a, b in zip(bot.times, bot.times[1:])]
+    assert len(gaps) == 3
+    assert min(gaps) >= 1 / TG_MAX_MESSAGES_PER_SEC * 0.9
+
+
+def test_send_errors_reach_every_merged_caller():
+    sender = TelegramSender(FakeBot(fail=True))
+
+    async def driver() -> list:
+        return await asyncio.gather(
+            sender.send(1, "a"), sender.send(1, "b"), return_exceptions=True,
+        )
+
+    results = asyncio.run(driver())
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+
+def test_one_sender_per_bot():
+    bot = FakeBot()
+    assert get_telegram_sender(bot) is get_telegram_sender(bot)
+    assert get_telegram_sender(FakeBot()) is not get_telegram_sender(bot)
+
+
+def test_typing_indicator_is_a_chat_action_not_a_message():
+    bot = FakeBot()
+
+    async def driver() -> None:
+        typing = asyncio.create_task(_keep_typing(bot, 7, message_thread_id=3))
+        await asyncio.sleep(0)
+        typing.cancel()
+
+    asyncio.run(driver())
+    assert bot.actions == [(7, "typing", 3)]
+    assert bot.sent == []
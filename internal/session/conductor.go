@@ -77,6 +77,10 @@ type ConductorSettings struct {
 	// nil/absent = disabled (preserves pre-*int behavior), 0 = disabled, >0 = configured
 	HeartbeatInterval *int `toml:"heartbeat_interval,omitempty"`
 
+	// MaxConcurrentCLI caps how many agent-deck CLI processes the bridge runs at once
+	// 0/absent = bridge default (16)
+	MaxConcurrentCLI int `toml:"max_concurrent_cli,omitempty"`
+
 	// Profiles is the list of agent-deck profiles to manage
 	// Kept for backward compat but ignored after migration to meta.json-based discovery
 	Profiles []string `toml:"profiles,omitempty"`
@@ -134,6 +138,10 @@ type SlackSettings struct {
 	// If empty, all users are allowed (backward compatible).
 	// Get user ID from Slack: Right-click user → View profile → More → Copy member ID
 	AllowedUserIDs []string `toml:"allowed_user_ids,omitempty"`
+
+	// DefaultRole is the role recorded for each allowed user in the bridge's allowlist.
+	// Default: "user"
+	DefaultRole string `toml:"default_role,omitempty"`
 }
 
 // DiscordSettings defines Discord bot configuration for the conductor bridge
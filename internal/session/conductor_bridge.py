@@ -11,33 +11,56 @@ Discovers conductors dynamically from meta.json files in ~/.agent-deck/conductor
 Each conductor has its own name, profile, and heartbeat settings.
 
 Dependencies: pip3 install toml aiogram slack-bolt slack-sdk discord.py
+  - toml is only needed on Python < 3.11 without tomli (3.11+ uses stdlib tomllib)
   - aiogram is only needed if Telegram is configured
   - slack-bolt/slack-sdk are only needed if Slack is configured
   - discord.py is only needed if Discord is configured
+  - orjson is optional; when installed it is used to parse CLI JSON output
 """
 
 from __future__ import annotations
 
 import asyncio
+import atexit
 import functools
 import json
 import logging
 import os
+import queue
 import re
+import shutil
 import signal
 import subprocess
 import sys
 import time
-from collections import deque
+from collections import Counter, deque
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Callable, Coroutine
 
-import toml
+# TOML parsing: stdlib tomllib (C-accelerated) on 3.11+, else the tomli
+# backport, else the legacy pure-Python toml package.
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+        import toml
+
+# Optional C JSON decoder for CLI output (falls back to stdlib json).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+# catching the stdlib exception either way.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Conditional imports for Telegram
 try:
-    from aiogram import Bot, Dispatcher, types
-    from aiogram.filters import Command, CommandStart
+    from aiogram import Bot, Dispatcher, F, types
     from aiogram.client.session.aiohttp import AiohttpSession
     HAS_AIOGRAM = True
 except ImportError:
@@ -128,9 +151,20 @@ LOG_PATH = CONDUCTOR_DIR / "bridge.log"
 # Telegram message length limit
 TG_MAX_LENGTH = 4096
 
+# Telegram allows a bot roughly 30 messages per second across all chats; going
+# faster earns 429s that stall every chat at once.
+TG_MAX_MESSAGES_PER_SEC = 30
+
+# A Telegram "typing" chat action shows for about 5 seconds; refresh it a
+# little sooner while the conductor is still working on a reply.
+TG_TYPING_REFRESH = 4.0  # seconds
+
 # Slack message length limit
 SLACK_MAX_LENGTH = 40000
 
+# Unauthorized Slack users are logged as a per-user tally at most this often.
+SLACK_REJECT_LOG_INTERVAL = 5.0  # seconds
+
 # Discord message length limit
 DISCORD_MAX_LENGTH = 2000
 
@@ -140,25 +174,43 @@ IMAGE_MARKER_RE = re.compile(r"\[IMAGE:(?P<path>[^\]]+)\]")
 # How long to wait for conductor to respond (seconds)
 RESPONSE_TIMEOUT = 300
 
+# Streamed replies are forwarded once this much text has accumulated (or at a
+# tool call / end of turn), keeping each chunk under TG_MAX_LENGTH after HTML
+# conversion.
+STREAM_FLUSH_CHARS = 3500
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
 
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
 # Mirror the deployed bridge's file logging (<data>/conductor/bridge.log) when
 # the conductor data dir already exists. Guard so importing this module in an
 # environment without that dir (e.g. CI/tests) never fails at import time.
-_log_handlers = [logging.StreamHandler(sys.stdout)]
+#
+# Every write is handed to a QueueListener thread: the event loop only
+# enqueues the record, so a slow disk never stalls message handling. That
+# includes stdout, which the launchd/systemd units append to bridge.log too.
+_log_sinks: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
 try:
     if CONDUCTOR_DIR.exists():
-        _log_handlers.append(logging.FileHandler(LOG_PATH, encoding="utf-8"))
+        _log_sinks.append(logging.FileHandler(LOG_PATH, encoding="utf-8"))
 except OSError:
     pass
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=_log_handlers,
-)
+for _sink in _log_sinks:
+    _sink.setFormatter(logging.Formatter(LOG_FORMAT))
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+# QueueHandler bakes the message (args, traceback) into the record; timestamp
+# and level are added by each sink's formatter.
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, *_log_sinks)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 log = logging.getLogger("conductor-bridge")
 
 
@@ -210,7 +262,11 @@ def load_config() -> dict:
         log.error("Config not found: %s", CONFIG_PATH)
         sys.exit(1)
 
-    config = toml.load(CONFIG_PATH)
+    if tomllib is not None:
+        with open(CONFIG_PATH, "rb") as f:
+            config = tomllib.load(f)
+    else:
+        config = toml.load(CONFIG_PATH)
     conductor_cfg = config.get("conductor", {})
 
     # The conductor system is "active" when at least one conductor exists on
@@ -242,6 +298,7 @@ def load_config() -> dict:
     sl_channel_id = sl.get("channel_id", "")
     sl_listen_mode = sl.get("listen_mode", "mentions")  # "mentions" or "all"
     sl_allowed_users = sl.get("allowed_user_ids", [])  # List of authorized Slack user IDs
+    sl_default_role = sl.get("default_role", "user")  # Role given to each allowed user
     sl_configured = bool(sl_bot_token and sl_app_token and sl_channel_id)
 
     # Discord config
@@ -275,6 +332,7 @@ def load_config() -> dict:
             "channel_id": sl_channel_id,
             "listen_mode": sl_listen_mode,
             "allowed_user_ids": sl_allowed_users,
+            "default_role": sl_default_role,
             "configured": sl_configured,
         },
         "discord": {
@@ -287,6 +345,9 @@ def load_config() -> dict:
             "configured": dc_configured,
         },
         "heartbeat_interval": conductor_cfg.get("heartbeat_interval", 15),
+        "max_concurrent_cli": int(
+            conductor_cfg.get("max_concurrent_cli", MAX_CONCURRENT_CLI) or MAX_CONCURRENT_CLI
+        ),
     }
 
 
@@ -311,8 +372,13 @@ def discover_conductors() -> list[dict]:
     return conductors
 
 
+@functools.lru_cache(maxsize=None)
 def conductor_session_title(name: str) -> str:
-    """Return the conductor session title for a given conductor name."""
+    """Return the conductor session title for a given conductor name.
+
+    Memoized: it is derived on every message and heartbeat tick, and the set
+    of conductor names is small.
+    """
     return f"conductor-{name}"
 
 
@@ -327,6 +393,11 @@ def get_default_conductor() -> dict | None:
     return conductors[0] if conductors else None
 
 
+def conductor_agent(conductor: dict) -> str:
+    """Return the conductor's agent runtime (meta.json "agent"), default claude."""
+    return (conductor.get("agent") or "claude").strip().lower()
+
+
 def get_unique_profiles() -> list[str]:
     """Get unique profile names from all conductors."""
     profiles = set()
@@ -353,32 +424,105 @@ def select_heartbeat_conductors(conductors: list[dict]) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
-def run_cli(
-    *args: str, profile: str | None = None, timeout: int = 120
-) -> subprocess.CompletedProcess:
-    """Run an agent-deck CLI command and return the result.
+# Absolute path of the agent-deck binary, resolved on first use so every CLI
+# call execs it directly instead of re-walking $PATH per spawn.
+_agent_deck_bin: str | None = None
 
-    If profile is provided, prepends -p <profile> to the command.
-    """
-    cmd = ["agent-deck"]
+
+def _resolve_agent_deck_bin() -> str:
+    """Return the cached agent-deck path, or the bare name if not on PATH yet."""
+    global _agent_deck_bin
+    if _agent_deck_bin is None:
+        found = shutil.which("agent-deck")
+        if not found:
+            return "agent-deck"  # let exec report FileNotFoundError as before
+        _agent_deck_bin = found
+    return _agent_deck_bin
+
+
+def _forget_agent_deck_bin() -> None:
+    """Drop the cached path (binary moved/removed) so the next call re-resolves."""
+    global _agent_deck_bin
+    _agent_deck_bin = None
+
+
+def _cli_command(args: tuple[str, ...], profile: str | None) -> list[str]:
+    """Build the argv for an agent-deck invocation."""
+    cmd = [_resolve_agent_deck_bin()]
     if profile:
         cmd += ["-p", profile]
     cmd += list(args)
-    log.debug("CLI: %s", " ".join(cmd))
-    try:
-        # Use Popen + communicate(timeout=) so we have the proc object available
-        # when TimeoutExpired fires — subprocess.run() does NOT set exc.proc.
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            start_new_session=True,  # own process group -> killpg kills grandchildren too
+    return cmd
+
+
+# Upper bound on agent-deck processes the bridge runs at once, so a burst of
+# messages and commands can't fork an unbounded number of CLIs. main() applies
+# [conductor].max_concurrent_cli from config.toml.
+MAX_CONCURRENT_CLI = 16
+
+# Conductor sends (`session send --wait` / `--stream`) can hold a process for
+# up to RESPONSE_TIMEOUT, so they draw from their own pool: a few slow replies
+# must not use up the slots that /status and the heartbeat's quick queries need.
+MAX_CONCURRENT_SENDS = 16
+
+# asyncio primitives bind to a loop (at creation on Python < 3.10), so the
+# semaphores are created lazily per running loop rather than at import time.
+_cli_slots: dict[bool, asyncio.Semaphore] = {}
+_cli_slots_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _cli_semaphore(long_running: bool = False) -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent CLI children on this loop.
+
+    long_running selects the separate pool for conductor sends.
+    """
+    global _cli_slots_loop
+    loop = asyncio.get_running_loop()
+    if _cli_slots_loop is not loop:
+        _cli_slots.clear()
+        _cli_slots_loop = loop
+    slots = _cli_slots.get(long_running)
+    if slots is None:
+        slots = asyncio.Semaphore(
+            MAX_CONCURRENT_SENDS if long_running else MAX_CONCURRENT_CLI
         )
+        _cli_slots[long_running] = slots
+    return slots
+
+
+async def run_cli(
+    *args: str,
+    profile: str | None = None,
+    timeout: int = 120,
+    long_running: bool = False,
+) -> subprocess.CompletedProcess:
+    """Run an agent-deck CLI command and return the result.
+
+    If profile is provided, prepends -p <profile> to the command. Pass
+    long_running=True for conductor sends that wait on a reply.
+
+    The child is awaited with asyncio.create_subprocess_exec, so a long
+    `session send --wait` never blocks the event loop: other chats, slash
+    commands and the heartbeat keep being served while it runs.
+    """
+    cmd = _cli_command(args, profile)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("CLI: %s", " ".join(cmd))
+    async with _cli_semaphore(long_running):
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,  # own process group -> killpg kills grandchildren too
+            )
+        except FileNotFoundError:
+            _forget_agent_deck_bin()
+            log.error("agent-deck not found in PATH")
+            return subprocess.CompletedProcess(cmd, 1, "", "not found")
         try:
-            stdout, stderr = proc.communicate(timeout=timeout)
-            return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
-        except subprocess.TimeoutExpired:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
             log.warning("CLI timeout: %s", " ".join(cmd))
             try:
                 # Kill the entire process group so grandchildren (e.g. tmux send-keys)
@@ -386,45 +530,82 @@ def run_cli(
                 os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
             except (ProcessLookupError, PermissionError):
                 proc.kill()  # fallback: kill direct child only
-            proc.communicate()
+            await proc.wait()
             return subprocess.CompletedProcess(cmd, 1, "", "timeout")
-    except FileNotFoundError:
-        log.error("agent-deck not found in PATH")
-        return subprocess.CompletedProcess(cmd, 1, "", "not found")
+        return subprocess.CompletedProcess(
+            cmd,
+            proc.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+
+# How long a known-good session status may be reused without asking the CLI
+# again (seconds). Only liveness checks opt in (see get_session_status).
+STATUS_TTL = 10.0
 
+# Last observed status per (profile, session): (monotonic timestamp, status).
+_status_cache: dict[tuple[str | None, str], tuple[float, str]] = {}
 
-def get_session_status(session: str, profile: str | None = None) -> str:
+
+def _invalidate_session_status(session: str, profile: str | None = None) -> None:
+    """Drop the cached status so the next liveness check hits the CLI."""
+    _status_cache.pop((profile, session), None)
+
+
+async def get_session_status(
+    session: str, profile: str | None = None, max_age: float = 0.0
+) -> str:
     """Get the status of a session (running/waiting/idle/error/unknown).
 
     Returns "unknown" on CLI failure or parse error — callers should treat
     this as a transient condition and retry rather than dropping state.
+
+    max_age > 0 lets the caller accept a status observed within the last
+    max_age seconds instead of spawning `session show` again. Only healthy
+    statuses are reused; "error" and "unknown" always re-query. Busy checks
+    must keep the default (always fresh) — a stale "idle" would send into a
+    turn that is already running.
     """
-    result = run_cli(
+    key = (profile, session)
+    if max_age > 0:
+        cached = _status_cache.get(key)
+        if cached is not None:
+            observed_at, status = cached
+            if (
+                time.monotonic() - observed_at < max_age
+                and status not in ("error", "unknown")
+            ):
+                return status
+
+    result = await run_cli(
         "session", "show", session, "--json", profile=profile, timeout=30
     )
     if result.returncode != 0:
         return "unknown"  # transient CLI failure — not the same as conductor broken
     try:
-        data = json.loads(result.stdout)
-        return data.get("status", "unknown")
+        data = _json_loads(result.stdout)
+        status = data.get("status", "unknown")
     except (json.JSONDecodeError, KeyError):
         return "unknown"
+    _status_cache[key] = (time.monotonic(), status)
+    return status
 
 
-def get_session_output(session: str, profile: str | None = None) -> str:
+async def get_session_output(session: str, profile: str | None = None) -> str:
     """Get the last response from a session.
 
     Uses --json mode so we get the structured 'content' field (the actual
     assistant reply) instead of the raw pane capture (which includes the
     cosmetic frame / statusline at the top and can be mistaken for a reply).
     """
-    result = run_cli(
+    result = await run_cli(
         "session", "output", session, "--json", profile=profile, timeout=30
     )
     if result.returncode != 0:
         return f"[Error getting output: {result.stderr.strip()}]"
     try:
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
         return (data.get("content") or "").strip()
     except json.JSONDecodeError:
         # Fallback: stdout might be the legacy raw-text format.
@@ -449,14 +630,13 @@ def _is_still_running_timeout(stderr: str) -> bool:
     return "timeout waiting for completion" in s or "still running" in s
 
 
-def send_to_conductor(
+async def send_to_conductor(
     session: str,
     message: str,
     profile: str | None = None,
     wait_for_reply: bool = False,
     response_timeout: int = RESPONSE_TIMEOUT,
     reply_callback: ReplyCallback | None = None,
-    force_queue: bool = False,
 ) -> tuple[bool, str, bool]:
     """Send a message to the conductor session.
 
@@ -466,49 +646,15 @@ def send_to_conductor(
     was delivered and the reply should be awaited asynchronously); it is False
     in every other case.
 
-    When wait_for_reply=False and the conductor is busy (running/active/starting),
-    the message is queued in-memory and delivered automatically once the conductor
-    returns to idle/waiting state (see _drain_queue). reply_callback, if provided,
-    is an async callable(response_text: str) invoked after drain delivery.
-
-    force_queue=True skips the internal status check and enqueues immediately.
-    Use this when the caller already knows the conductor is busy to avoid a
-    redundant blocking subprocess call.
+    wait_for_reply=False is for callers that already know the conductor is
+    busy: the message is queued in-memory and delivered with the same
+    single-call `--wait` flow once the conductor returns to idle/waiting
+    (see _drain_queue). reply_callback, if provided, is an async
+    callable(response_text: str) invoked after drain delivery.
     """
     if not wait_for_reply:
-        # force_queue: caller already confirmed conductor is busy — skip status check.
-        if force_queue:
-            log.info("Conductor %s: force-queueing message", session)
-            _enqueue_message(session, message, profile, reply_callback)
-            return True, "", False
-
-        # For non-blocking sends (user messages), check if conductor is busy
-        # and queue instead of dropping.
-        status = get_session_status(session, profile=profile)
-        if status in ("running", "active", "starting"):
-            log.info(
-                "Conductor %s is busy (%s), queueing message", session, status,
-            )
-            _enqueue_message(session, message, profile, reply_callback)
-            return True, "", False  # queued, not failed
-
-        result = run_cli(
-            "session", "send", session, message, "--no-wait",
-            profile=profile, timeout=30,
-        )
-        if result.returncode != 0:
-            stderr = result.stderr.strip()
-            # If the conductor became busy between the status check and the send,
-            # queue instead of dropping.
-            if "timeout" in stderr.lower() or "not ready" in stderr.lower():
-                log.info(
-                    "Conductor %s became busy during send, queueing message",
-                    session,
-                )
-                _enqueue_message(session, message, profile, reply_callback)
-                return True, "", False
-            log.error("Failed to send to conductor: %s", stderr)
-            return False, "", False
+        log.info("Conductor %s: queueing message", session)
+        _enqueue_message(session, message, profile, reply_callback)
         return True, "", False
 
     # wait_for_reply=True: single-call flow used by heartbeats and the idle
@@ -516,11 +662,12 @@ def send_to_conductor(
     # we then re-fetch the clean reply via get_session_output (`session output
     # --json` -> content), rather than parsing the raw `--wait` pane capture.
     # This mirrors the deployed bridge's reply-capture (issue #926).
-    result = run_cli(
+    result = await run_cli(
         "session", "send", session, message,
         "--wait", "--timeout", f"{response_timeout}s", "-q",
         profile=profile,
         timeout=max(response_timeout + 30, 60),
+        long_running=True,
     )
     if result.returncode != 0:
         stderr = result.stderr.strip()
@@ -535,8 +682,139 @@ def send_to_conductor(
             )
             return False, "", True
         log.error("Failed to send to conductor: %s", stderr)
+        _invalidate_session_status(session, profile)
         return False, "", False
-    return True, get_session_output(session, profile=profile), False
+    return True, await get_session_output(session, profile=profile), False
+
+
+async def send_to_conductor_streaming(
+    session: str,
+    message: str,
+    on_chunk: ReplyCallback,
+    profile: str | None = None,
+    response_timeout: int = RESPONSE_TIMEOUT,
+) -> tuple[bool, str, bool]:
+    """Send a message and forward the reply to on_chunk as it is written.
+
+    Uses `session send --stream`, which tails the Claude transcript and emits
+    one JSON event per line (start | text | tool_use | tool_result | stop |
+    error). Text deltas are buffered and handed to on_chunk whenever
+    STREAM_FLUSH_CHARS accumulate, at each tool call, and at end of turn, so
+    the user sees the first part of a long reply long before the turn ends.
+
+    Returns (success, full_response_text, still_running) with the same meaning
+    as send_to_conductor's wait path. Any stream event proves the message was
+    delivered, so a stream that errors or times out after that reports
+    still_running=True and the caller watches for the rest of the reply.
+    Claude conductors only — other agents must use send_to_conductor.
+    """
+    cmd = _cli_command(
+        (
+            "session", "send", session, message, "--stream",
+            "--timeout", f"{response_timeout}s",
+            "--stream-idle", f"{response_timeout}s",
+        ),
+        profile,
+    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("CLI: %s", " ".join(cmd))
+
+    parts: list[str] = []
+    pending = ""
+    delivered = False
+    finished = False
+    failure = ""
+
+    async def flush(final: bool = False) -> None:
+        nonlocal pending
+        while len(pending) >= STREAM_FLUSH_CHARS or (final and pending):
+            cut = len(pending)
+            if cut > STREAM_FLUSH_CHARS:
+                # Prefer a line boundary so markdown blocks stay intact.
+                cut = pending.rfind("\n", 0, STREAM_FLUSH_CHARS) + 1 or STREAM_FLUSH_CHARS
+            chunk, pending = pending[:cut], pending[cut:]
+            if chunk.strip():
+                await _fire_callback(on_chunk, chunk.strip())
+
+    async def consume() -> None:
+        nonlocal pending, delivered, finished, failure
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                return
+            try:
+                event = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(event, dict):
+                continue
+            delivered = True
+            kind = event.get("type")
+            if kind == "text":
+                delta = event.get("delta", "")
+                parts.append(delta)
+                pending += delta
+                await flush()
+            elif kind == "tool_use":
+                # Text around a tool call reaches the chat as separate
+                # messages; keep them on separate lines in the reply too.
+                if parts and parts[-1] != "\n":
+                    parts.append("\n")
+                await flush(final=True)
+            elif kind == "stop":
+                finished = True
+            elif kind == "error":
+                failure = event.get("message", "stream error")
+
+    async with _cli_semaphore(long_running=True):
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+                limit=16 * 1024 * 1024,  # tool_use lines carry whole tool inputs
+            )
+        except FileNotFoundError:
+            _forget_agent_deck_bin()
+            log.error("agent-deck not found in PATH")
+            return False, "", False
+
+        # Drain stderr alongside stdout so a chatty child can't fill the pipe.
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
+        try:
+            await asyncio.wait_for(consume(), max(response_timeout + 30, 60))
+            await proc.wait()
+        except asyncio.TimeoutError:
+            log.warning("CLI timeout: %s", " ".join(cmd))
+            failure = failure or "timeout"
+        except BaseException:
+            # Cancelled, or readline() hit the stream limit.
+            stderr_task.cancel()
+            raise
+        finally:
+            # Never leave the child (or its grandchildren) running.
+            if proc.returncode is None:
+                try:
+                    os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+                except (ProcessLookupError, PermissionError):
+                    proc.kill()
+                await proc.wait()
+        stderr = (await stderr_task).decode("utf-8", errors="replace").strip()
+    await flush(final=True)
+    response = "".join(parts).strip()
+
+    if finished and proc.returncode == 0:
+        return True, response, False
+    if delivered:
+        log.info(
+            "Conductor %s: stream ended before end of turn (%s), reply pending",
+            session, failure or f"exit {proc.returncode}",
+        )
+        return False, response, True
+    log.error("Failed to send to conductor: %s", stderr or failure)
+    _invalidate_session_status(session, profile)
+    return False, "", False
 
 
 # ---------------------------------------------------------------------------
@@ -567,13 +845,13 @@ def _enqueue_message(
     """
     if session not in _message_queue:
         _message_queue[session] = deque()
-    queue = _message_queue[session]
-    if len(queue) >= MAX_QUEUE_DEPTH:
+    pending = _message_queue[session]
+    if len(pending) >= MAX_QUEUE_DEPTH:
         log.warning(
             "Queue full for %s (depth=%d), dropping oldest message",
             session, MAX_QUEUE_DEPTH,
         )
-        _msg, _prof, dropped_cb = queue.popleft()
+        _msg, _prof, dropped_cb = pending.popleft()
         if dropped_cb is not None:
             try:
                 loop = asyncio.get_running_loop()
@@ -583,8 +861,8 @@ def _enqueue_message(
                 ))
             except RuntimeError:
                 pass  # no event loop available, can't fire async callback
-    queue.append((message, profile, reply_callback))
-    log.info("Queued message for %s (queue depth: %d)", session, len(queue))
+    pending.append((message, profile, reply_callback))
+    log.info("Queued message for %s (queue depth: %d)", session, len(pending))
     _ensure_drain_task()
 
 
@@ -649,10 +927,7 @@ async def _drain_queue() -> None:
 
             message, profile, reply_callback = items[0]
             loop = asyncio.get_running_loop()
-            status = await loop.run_in_executor(
-                None,
-                functools.partial(get_session_status, session, profile=profile),
-            )
+            status = await get_session_status(session, profile=profile)
 
             # Still busy or transient CLI failure — retry next cycle
             if status in ("running", "active", "starting", "unknown"):
@@ -673,15 +948,12 @@ async def _drain_queue() -> None:
                 continue
 
             # Conductor is ready — deliver the message and wait for the response
-            result = await loop.run_in_executor(
-                None,
-                functools.partial(
-                    run_cli,
-                    "session", "send", session, message,
-                    "--wait", "--timeout", f"{RESPONSE_TIMEOUT}s", "-q",
-                    profile=profile,
-                    timeout=max(RESPONSE_TIMEOUT + 30, 60),
-                ),
+            result = await run_cli(
+                "session", "send", session, message,
+                "--wait", "--timeout", f"{RESPONSE_TIMEOUT}s", "-q",
+                profile=profile,
+                timeout=max(RESPONSE_TIMEOUT + 30, 60),
+                long_running=True,
             )
             if result.returncode == 0:
                 items.popleft()
@@ -695,11 +967,8 @@ async def _drain_queue() -> None:
                 if reply_callback is not None:
                     # Re-fetch the clean reply via get_session_output (consistent
                     # with send_to_conductor's wait path) rather than the raw
-                    # `--wait` stdout. Off-loop to avoid blocking the drain.
-                    output = await loop.run_in_executor(
-                        None,
-                        functools.partial(get_session_output, session, profile=profile),
-                    )
+                    # `--wait` stdout.
+                    output = await get_session_output(session, profile=profile)
                     text = output.strip() or "[No output from conductor.]"
                     loop.create_task(_fire_callback(reply_callback, text))
             else:
@@ -714,6 +983,7 @@ async def _drain_queue() -> None:
                         "Failed to deliver queued message to %s: %s — dropping",
                         session, stderr,
                     )
+                    _invalidate_session_status(session, profile)
                     items.popleft()
                     if not items:
                         _message_queue.pop(session, None)
@@ -756,6 +1026,7 @@ async def _watch_pending_reply(
     session: str,
     profile: str | None,
     reply_callback: ReplyCallback,
+    already_sent: str = "",
 ) -> None:
     """Wait for an in-flight conductor turn to finish, then deliver its output.
 
@@ -766,13 +1037,13 @@ async def _watch_pending_reply(
 
     Mirrors _drain_queue's polling/backoff but never sends a message. Caps the
     total wait at PENDING_REPLY_MAX_WAIT and logs if it gives up.
+
+    already_sent is reply text a streamed send has already put in the chat;
+    only the rest of the output is delivered, and nothing if none is left.
     """
-    loop = asyncio.get_running_loop()
     max_polls = max(1, PENDING_REPLY_MAX_WAIT // PENDING_REPLY_POLL_INTERVAL)
     for _ in range(max_polls):
-        status = await loop.run_in_executor(
-            None, functools.partial(get_session_status, session, profile=profile),
-        )
+        status = await get_session_status(session, profile=profile)
         # Still working, or a transient CLI failure — keep waiting. This also
         # naturally handles the race where the conductor finishes between the
         # timeout and this first poll: a non-busy status falls straight through
@@ -782,10 +1053,16 @@ async def _watch_pending_reply(
             continue
         # The turn is no longer running (idle/waiting/error/...) — fetch whatever
         # output is available and deliver it once.
-        output = await loop.run_in_executor(
-            None, functools.partial(get_session_output, session, profile=profile),
-        )
-        text = output.strip() or "[No output from conductor.]"
+        output = (await get_session_output(session, profile=profile)).strip()
+        if already_sent:
+            if output.startswith(already_sent):
+                output = output[len(already_sent):].strip()
+            elif output in already_sent:
+                output = ""
+            if not output:
+                log.info("Pending reply for %s was already streamed in full", session)
+                return
+        text = output or "[No output from conductor.]"
         await _fire_callback(reply_callback, text)
         log.info(
             "Pending reply for %s delivered after in-flight turn finished", session,
@@ -807,6 +1084,7 @@ def _register_pending_reply(
     session: str,
     profile: str | None,
     reply_callback: ReplyCallback,
+    already_sent: str = "",
 ) -> None:
     """Schedule a reply-only watcher for an in-flight turn (no message re-send).
 
@@ -818,43 +1096,123 @@ def _register_pending_reply(
     except RuntimeError:
         log.warning("No running event loop — cannot watch for pending reply on %s", session)
         return
-    task = loop.create_task(_watch_pending_reply(session, profile, reply_callback))
+    task = loop.create_task(
+        _watch_pending_reply(session, profile, reply_callback, already_sent)
+    )
     _pending_reply_tasks.add(task)
     task.add_done_callback(_pending_reply_tasks.discard)
 
 
-def get_status_summary(profile: str | None = None) -> dict:
+# ---------------------------------------------------------------------------
+# Per-conductor job queues for platform handlers
+# ---------------------------------------------------------------------------
+#
+# A user message ends in a `session send --wait` that can take RESPONSE_TIMEOUT
+# seconds. Handlers hand that work to a per-conductor worker instead of doing
+# it inline: jobs for one conductor run strictly in arrival order (no two
+# concurrent sends racing into the same pane), while different conductors —
+# and therefore different profiles — proceed in parallel.
+
+# Jobs allowed to wait behind the in-flight one before new messages are refused.
+CONDUCTOR_JOB_QUEUE_SIZE = 8
+
+ConductorJob = Callable[[], Coroutine[Any, Any, None]]
+
+# {(profile, session_title): queue of waiting jobs}; the worker task exists
+# exactly while a job is running or waiting. Both are created lazily inside
+# the running loop and dropped once the queue drains. _conductor_active holds
+# the keys whose worker is currently inside a job.
+_conductor_jobs: dict[tuple[str | None, str], asyncio.Queue] = {}
+_conductor_workers: dict[tuple[str | None, str], asyncio.Task] = {}
+_conductor_active: set[tuple[str | None, str]] = set()
+
+
+async def _conductor_worker(key: tuple[str | None, str], jobs: asyncio.Queue) -> None:
+    """Run queued jobs for one conductor one at a time, then exit when idle."""
+    while not jobs.empty():
+        job = jobs.get_nowait()
+        _conductor_active.add(key)
+        try:
+            await job()
+        except Exception:
+            log.exception("Conductor job for %s failed", key[1])
+        finally:
+            _conductor_active.discard(key)
+            jobs.task_done()
+    _conductor_jobs.pop(key, None)
+    _conductor_workers.pop(key, None)
+
+
+def _submit_conductor_job(
+    session: str, profile: str | None, job: ConductorJob,
+) -> int | None:
+    """Queue job behind any earlier work for this conductor.
+
+    Returns how many jobs are ahead of it (0 means it starts right away), or
+    None if CONDUCTOR_JOB_QUEUE_SIZE jobs are already waiting and it was
+    refused. Must be called from the running event loop.
+    """
+    key = (profile, session)
+    jobs = _conductor_jobs.get(key)
+    if jobs is None:
+        jobs = asyncio.Queue(maxsize=CONDUCTOR_JOB_QUEUE_SIZE)
+        _conductor_jobs[key] = jobs
+    ahead = jobs.qsize() + (1 if key in _conductor_active else 0)
+    try:
+        jobs.put_nowait(job)
+    except asyncio.QueueFull:
+        log.warning("Job queue full for %s, refusing message", session)
+        return None
+    # A worker that died without reaching its cleanup (e.g. cancelled) leaves
+    # a stale entry behind; replace it rather than stranding the queue.
+    if key not in _conductor_workers or _conductor_workers[key].done():
+        _conductor_workers[key] = asyncio.get_running_loop().create_task(
+            _conductor_worker(key, jobs)
+        )
+    return ahead
+
+
+STATUS_SUMMARY_KEYS = ("waiting", "running", "idle", "error", "stopped", "total")
+
+
+async def get_status_summary(profile: str | None = None) -> dict:
     """Get agent-deck status as a dict for a single profile."""
-    result = run_cli("status", "--json", profile=profile, timeout=30)
+    result = await run_cli("status", "--json", profile=profile, timeout=30)
     if result.returncode != 0:
         return {"waiting": 0, "running": 0, "idle": 0, "error": 0, "stopped": 0, "total": 0}
     try:
-        return json.loads(result.stdout)
+        return _json_loads(result.stdout)
     except json.JSONDecodeError:
         return {"waiting": 0, "running": 0, "idle": 0, "error": 0, "stopped": 0, "total": 0}
 
 
-def get_status_summary_all(profiles: list[str]) -> dict:
-    """Aggregate status across all profiles."""
-    totals = {"waiting": 0, "running": 0, "idle": 0, "error": 0, "stopped": 0, "total": 0}
+async def get_status_summary_all(profiles: list[str]) -> dict:
+    """Aggregate status across all profiles.
+
+    One `status --json` per profile, run concurrently: wall time is the
+    slowest profile rather than the sum of all of them.
+    """
+    summaries = await asyncio.gather(
+        *(get_status_summary(profile) for profile in profiles)
+    )
+    # Seeded so every key is present even when no profile reports it.
+    totals = Counter(dict.fromkeys(STATUS_SUMMARY_KEYS, 0))
     per_profile = {}
-    for profile in profiles:
-        summary = get_status_summary(profile)
+    for profile, summary in zip(profiles, summaries):
         per_profile[profile] = summary
-        for key in totals:
-            totals[key] += summary.get(key, 0)
-    return {"totals": totals, "per_profile": per_profile}
+        totals.update({key: summary.get(key, 0) for key in STATUS_SUMMARY_KEYS})
+    return {"totals": dict(totals), "per_profile": per_profile}
 
 
-def get_sessions_list(
+async def get_sessions_list(
     profile: str | None = None, *, fail_closed: bool = False
 ) -> list | None:
     """Get list of all sessions for a single profile."""
-    result = run_cli("list", "--json", profile=profile, timeout=30)
+    result = await run_cli("list", "--json", profile=profile, timeout=30)
     if result.returncode != 0:
         return None if fail_closed else []
     try:
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
         # list --json returns {"sessions": [...]}
         if isinstance(data, dict):
             sessions = data.get("sessions")
@@ -870,12 +1228,25 @@ def get_sessions_list(
         return None if fail_closed else []
 
 
-def get_sessions_list_all(profiles: list[str]) -> list[tuple[str, dict]]:
+async def get_sessions_by_profile(profiles: list[str]) -> dict[str, list]:
+    """List sessions for each profile concurrently, one CLI call per profile.
+
+    Failed listings map to []. Keys follow the order of ``profiles``.
+    """
+    results = await asyncio.gather(
+        *(get_sessions_list(profile) for profile in profiles)
+    )
+    return {
+        profile: sessions or [] for profile, sessions in zip(profiles, results)
+    }
+
+
+async def get_sessions_list_all(profiles: list[str]) -> list[tuple[str, dict]]:
     """Get sessions from all profiles, each tagged with profile name."""
+    by_profile = await get_sessions_by_profile(profiles)
     all_sessions = []
-    for profile in profiles:
-        sessions = get_sessions_list(profile)
-        for s in sessions or []:
+    for profile, sessions in by_profile.items():
+        for s in sessions:
             all_sessions.append((profile, s))
     return all_sessions
 
@@ -919,45 +1290,57 @@ def _find_conductor_session_by_path(
     return (matches[0] if matches else None), False
 
 
+# After `session start`, poll the conductor's status this often, at most
+# CONDUCTOR_START_POLLS times, instead of sleeping a fixed 5s before one check.
+CONDUCTOR_START_POLL_INTERVAL = 0.25  # seconds
+CONDUCTOR_START_POLLS = 20
+
+
+async def _wait_for_conductor_start(session: str, profile: str) -> bool:
+    """Wait for a just-started conductor; True once it reports a ready status.
+
+    Returns as soon as the session is waiting/running/idle/active. "starting",
+    "error" and "unknown" are re-polled; after the last poll anything but
+    "error"/"unknown" still counts as started.
+    """
+    status = "unknown"
+    for attempt in range(CONDUCTOR_START_POLLS):
+        if attempt:
+            await asyncio.sleep(CONDUCTOR_START_POLL_INTERVAL)
+        status = await get_session_status(session, profile=profile)
+        if status in ("waiting", "running", "idle", "active"):
+            return True
+    return status not in ("error", "unknown")
+
+
 async def ensure_conductor_running(name: str, profile: str) -> bool:
     """Ensure the conductor session exists and is running."""
     session_title = conductor_session_title(name)
     session_path = str(CONDUCTOR_DIR / name)
-    loop = asyncio.get_running_loop()
-    status = await loop.run_in_executor(
-        None, functools.partial(get_session_status, session_title, profile=profile)
+    # Liveness only: a status seen within STATUS_TTL is good enough, which
+    # spares a `session show` per message/heartbeat while the conductor is up.
+    status = await get_session_status(
+        session_title, profile=profile, max_age=STATUS_TTL
     )
     if status in ("waiting", "running", "idle", "active", "starting"):
         return True
 
-    initial_start = await loop.run_in_executor(
-        None,
-        functools.partial(
-            run_cli,
-            "session",
-            "start",
-            session_title,
-            profile=profile,
-            timeout=60,
-        ),
+    initial_start = await run_cli(
+        "session",
+        "start",
+        session_title,
+        profile=profile,
+        timeout=60,
     )
     if initial_start.returncode == 0:
-        await asyncio.sleep(5)
-        final_status = await loop.run_in_executor(
-            None,
-            functools.partial(get_session_status, session_title, profile=profile),
-        )
-        return final_status not in ("error", "unknown")
+        return await _wait_for_conductor_start(session_title, profile)
 
     log.warning(
         "Failed to start conductor %s before dedupe: %s",
         name,
         initial_start.stderr.strip(),
     )
-    sessions = await loop.run_in_executor(
-        None,
-        functools.partial(get_sessions_list, profile=profile, fail_closed=True),
-    )
+    sessions = await get_sessions_list(profile=profile, fail_closed=True)
     if sessions is None:
         log.error(
             "Cannot verify conductor %s identity because list --json failed; "
@@ -1013,18 +1396,14 @@ async def ensure_conductor_running(name: str, profile: str) -> bool:
                 session_title,
                 session_ref,
             )
-            rename_result = await loop.run_in_executor(
-                None,
-                functools.partial(
-                    run_cli,
-                    "session",
-                    "set",
-                    session_ref,
-                    "title",
-                    session_title,
-                    profile=profile,
-                    timeout=60,
-                ),
+            rename_result = await run_cli(
+                "session",
+                "set",
+                session_ref,
+                "title",
+                session_title,
+                profile=profile,
+                timeout=60,
             )
             if rename_result.returncode != 0:
                 log.error(
@@ -1043,22 +1422,18 @@ async def ensure_conductor_running(name: str, profile: str) -> bool:
         )
     else:
         log.info("Creating conductor session for %s...", name)
-        result = await loop.run_in_executor(
-            None,
-            functools.partial(
-                run_cli,
-                "add",
-                session_path,
-                "-t",
-                session_title,
-                "-c",
-                "claude",
-                "-g",
-                "conductor",
-                "--title-lock",
-                profile=profile,
-                timeout=60,
-            ),
+        result = await run_cli(
+            "add",
+            session_path,
+            "-t",
+            session_title,
+            "-c",
+            "claude",
+            "-g",
+            "conductor",
+            "--title-lock",
+            profile=profile,
+            timeout=60,
         )
         if result.returncode != 0:
             log.error(
@@ -1068,16 +1443,12 @@ async def ensure_conductor_running(name: str, profile: str) -> bool:
             )
             return False
 
-    result = await loop.run_in_executor(
-        None,
-        functools.partial(
-            run_cli,
-            "session",
-            "start",
-            session_ref,
-            profile=profile,
-            timeout=60,
-        ),
+    result = await run_cli(
+        "session",
+        "start",
+        session_ref,
+        profile=profile,
+        timeout=60,
     )
     if result.returncode != 0:
         log.warning(
@@ -1088,11 +1459,7 @@ async def ensure_conductor_running(name: str, profile: str) -> bool:
         )
         return False
 
-    await asyncio.sleep(5)
-    final_status = await loop.run_in_executor(
-        None, functools.partial(get_session_status, session_ref, profile=profile)
-    )
-    return final_status not in ("error", "unknown")
+    return await _wait_for_conductor_start(session_ref, profile)
 
 
 # ---------------------------------------------------------------------------
@@ -1196,6 +1563,19 @@ def invoke_hook(
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=8)
+def _conductor_prefixes(conductor_names: tuple[str, ...]) -> tuple[tuple[str, ...], dict[str, str]]:
+    """Return ("<name>:" prefixes in lookup order, prefix -> name) for a name set.
+
+    Cached because the conductor set rarely changes while every message is
+    routed through it.
+    """
+    by_prefix: dict[str, str] = {}
+    for name in conductor_names:
+        by_prefix.setdefault(f"{name}:", name)
+    return tuple(by_prefix), by_prefix
+
+
 def parse_conductor_prefix(text: str, conductor_names: list[str]) -> tuple[str | None, str]:
     """Parse conductor name prefix from user message.
 
@@ -1204,10 +1584,13 @@ def parse_conductor_prefix(text: str, conductor_names: list[str]) -> tuple[str |
 
     Returns (name_or_None, cleaned_message).
     """
-    for name in conductor_names:
-        prefix = f"{name}:"
+    prefixes, by_prefix = _conductor_prefixes(tuple(conductor_names))
+    # One C-level probe rejects unprefixed messages (the common case).
+    if not text.startswith(prefixes):
+        return None, text
+    for prefix in prefixes:
         if text.startswith(prefix):
-            return name, text[len(prefix):].strip()
+            return by_prefix[prefix], text[len(prefix):].strip()
 
     return None, text
 
@@ -1283,18 +1666,24 @@ def split_message(text: str, max_len: int = TG_MAX_LENGTH) -> list[str]:
     if len(text) <= max_len:
         return [text]
 
+    # Walk one index forward through the original string instead of
+    # re-slicing the remainder each round, so long replies split in linear time.
     chunks = []
-    while text:
-        if len(text) <= max_len:
-            chunks.append(text)
+    start, end = 0, len(text)
+    while start < end:
+        if end - start <= max_len:
+            chunks.append(text[start:])
             break
         # Try to split at a newline
-        split_at = text.rfind("\n", 0, max_len)
+        split_at = text.rfind("\n", start, start + max_len)
         if split_at == -1:
             # No newline found, split at max_len
-            split_at = max_len
-        chunks.append(text[:split_at])
-        text = text[split_at:].lstrip("\n")
+            split_at = start + max_len
+        chunks.append(text[start:split_at])
+        # Newlines at the cut are dropped, not carried into the next chunk
+        start = split_at
+        while start < end and text[start] == "\n":
+            start += 1
     return chunks
 
 
@@ -1408,6 +1797,105 @@ async def send_discord_output(channel, text: str, name_tag: str = ""):
 # ---------------------------------------------------------------------------
 
 
+# Bot commands, optionally addressed as /cmd@botname; the verb is group 1 and
+# the bot username group 2.
+TG_COMMAND_RE = re.compile(r"^/(start|status|sessions|help|restart)(?:@(\w+))?(?:\s|$)")
+
+
+class TelegramSender:
+    """Paced, coalescing outbound message queue for one Telegram bot.
+
+    send() enqueues the text and returns once it has been delivered, so each
+    caller keeps its own ordering and still sees send errors. A single worker
+    drains the queue no faster than TG_MAX_MESSAGES_PER_SEC, and folds
+    consecutive texts for the same chat (and parse mode) into one message
+    while the result still fits in TG_MAX_LENGTH.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        # (chat_id, message_thread_id, parse_mode, text, delivered future)
+        self._pending: deque[tuple[int, int | None, str | None, str, asyncio.Future]] = deque()
+        self._worker: asyncio.Task | None = None
+        self._next_send_at = 0.0
+
+    async def send(
+        self,
+        chat_id: int,
+        text: str,
+        parse_mode: str | None = None,
+        message_thread_id: int | None = None,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        delivered = loop.create_future()
+        self._pending.append((chat_id, message_thread_id, parse_mode, text, delivered))
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._drain())
+        await delivered
+
+    async def _drain(self) -> None:
+        while self._pending:
+            delay = self._next_send_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            chat_id, thread_id, parse_mode, text, first = self._pending.popleft()
+            waiters = [first]
+            while self._pending:
+                nxt_chat, nxt_thread, nxt_mode, nxt_text, nxt_waiter = self._pending[0]
+                if (nxt_chat, nxt_thread, nxt_mode) != (chat_id, thread_id, parse_mode):
+                    break
+                if len(text) + 1 + len(nxt_text) > TG_MAX_LENGTH:
+                    break
+                self._pending.popleft()
+                text = f"{text}\n{nxt_text}"
+                waiters.append(nxt_waiter)
+            self._next_send_at = time.monotonic() + 1 / TG_MAX_MESSAGES_PER_SEC
+            try:
+                await self.bot.send_message(
+                    chat_id, text,
+                    parse_mode=parse_mode,
+                    message_thread_id=thread_id,
+                )
+            except Exception as e:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+            else:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+
+# One sender per bot: the rate limit is bot-wide, so the message handlers and
+# the heartbeat must share the same queue.
+_telegram_senders: dict[int, TelegramSender] = {}
+
+
+def get_telegram_sender(bot) -> TelegramSender:
+    """Return the shared TelegramSender for bot, creating it on first use."""
+    sender = _telegram_senders.get(id(bot))
+    if sender is None or sender.bot is not bot:
+        sender = TelegramSender(bot)
+        _telegram_senders[id(bot)] = sender
+    return sender
+
+
+async def _keep_typing(bot, chat_id: int, message_thread_id: int | None = None) -> None:
+    """Show the typing indicator in chat_id until cancelled.
+
+    Chat actions are not messages: they don't land in the chat history and
+    don't count against the TelegramSender pacing, so they bypass it.
+    """
+    while True:
+        try:
+            await bot.send_chat_action(
+                chat_id, "typing", message_thread_id=message_thread_id,
+            )
+        except Exception as e:
+            log.debug("send_chat_action failed: %s", e)
+        await asyncio.sleep(TG_TYPING_REFRESH)
+
+
 def create_telegram_bot(config: dict):
     """Create and configure the Telegram bot.
 
@@ -1487,7 +1975,6 @@ def create_telegram_bot(config: dict):
             flags=re.IGNORECASE,
         ).strip()
 
-    @dp.message(CommandStart())
     async def cmd_start(message: types.Message):
         if not is_authorized(message):
             return
@@ -1502,12 +1989,11 @@ def create_telegram_bot(config: dict):
             f"Default conductor: {default}"
         )
 
-    @dp.message(Command("status"))
     async def cmd_status(message: types.Message):
         if not is_authorized(message):
             return
         profiles = get_unique_profiles()
-        agg = get_status_summary_all(profiles)
+        agg = await get_status_summary_all(profiles)
         totals = agg["totals"]
 
         lines = [
@@ -1530,12 +2016,11 @@ def create_telegram_bot(config: dict):
 
         await message.answer("\n".join(lines))
 
-    @dp.message(Command("sessions"))
     async def cmd_sessions(message: types.Message):
         if not is_authorized(message):
             return
         profiles = get_unique_profiles()
-        all_sessions = get_sessions_list_all(profiles)
+        all_sessions = await get_sessions_list_all(profiles)
         if not all_sessions:
             await message.answer("No sessions found.")
             return
@@ -1557,7 +2042,6 @@ def create_telegram_bot(config: dict):
 
         await message.answer("\n".join(lines))
 
-    @dp.message(Command("help"))
     async def cmd_help(message: types.Message):
         if not is_authorized(message):
             return
@@ -1574,7 +2058,6 @@ def create_telegram_bot(config: dict):
             f"Default: messages go to first conductor"
         )
 
-    @dp.message(Command("restart"))
     async def cmd_restart(message: types.Message):
         if not is_authorized(message):
             return
@@ -1601,10 +2084,11 @@ def create_telegram_bot(config: dict):
         await message.answer(
             f"Restarting conductor {target['name']}..."
         )
-        result = run_cli(
+        result = await run_cli(
             "session", "restart", session_title,
             profile=target["profile"], timeout=60,
         )
+        _invalidate_session_status(session_title, target["profile"])
         if result.returncode == 0:
             await message.answer(
                 f"Conductor {target['name']} restarted."
@@ -1614,6 +2098,39 @@ def create_telegram_bot(config: dict):
                 f"Restart failed: {result.stderr.strip()}"
             )
 
+    commands = {
+        "start": cmd_start,
+        "status": cmd_status,
+        "sessions": cmd_sessions,
+        "help": cmd_help,
+        "restart": cmd_restart,
+    }
+
+    # One regex match routes every command, instead of aiogram trying a
+    # Command filter per handler on each incoming message.
+    @dp.message(F.text.regexp(TG_COMMAND_RE).as_("command"))
+    async def dispatch_command(message: types.Message, command: re.Match):
+        addressed_to = command.group(2)
+        if addressed_to:
+            # /cmd@OtherBot in a group is meant for another bot.
+            await ensure_bot_info(message.bot)
+            if addressed_to.lower() != bot_info["username"]:
+                return
+        await commands[command.group(1)](message)
+
+    sender = get_telegram_sender(bot)
+
+    async def reply(message: types.Message, text: str, parse_mode: str | None = None):
+        """Answer in the message's chat (and forum topic) via the paced sender."""
+        await sender.send(
+            message.chat.id,
+            text,
+            parse_mode=parse_mode,
+            message_thread_id=(
+                message.message_thread_id if message.is_topic_message else None
+            ),
+        )
+
     @dp.message()
     async def handle_message(message: types.Message):
         """Forward any text message to the conductor and return its response."""
@@ -1643,7 +2160,8 @@ def create_telegram_bot(config: dict):
         if target_conductor is None:
             target_conductor = get_default_conductor()
         if target_conductor is None:
-            await message.answer(
+            await reply(
+                message,
                 "[No conductors configured. Run: agent-deck conductor setup]"
             )
             return
@@ -1654,12 +2172,17 @@ def create_telegram_bot(config: dict):
 
         session_title = conductor_session_title(target_conductor["name"])
 
-        # Run pre-message hook (can transform or gate the message)
-        hook_result = invoke_hook(target_profile, "pre-message", {
-            "profile": target_profile,
-            "message_text": cleaned_msg,
-            "user_id": message.from_user.id,
-        })
+        # Run pre-message hook (can transform or gate the message).
+        # Hooks are plain subprocesses — run them off the event loop.
+        loop = asyncio.get_running_loop()
+        hook_result = await loop.run_in_executor(
+            None,
+            functools.partial(invoke_hook, target_profile, "pre-message", {
+                "profile": target_profile,
+                "message_text": cleaned_msg,
+                "user_id": message.from_user.id,
+            }),
+        )
         if hook_result is not None:
             success, stdout = hook_result
             if not success:
@@ -1668,86 +2191,30 @@ def create_telegram_bot(config: dict):
             if stdout:
                 cleaned_msg = stdout
 
-        # Ensure conductor is running for this profile
-        if not await ensure_conductor_running(target_conductor["name"], target_profile):
-            await message.answer(
-                f"[Could not start conductor for {target_profile}. Check agent-deck.]"
-            )
-            return
-
         profiles = get_unique_profiles()
         profile_tag = f"[{target_profile}] " if len(profiles) > 1 else ""
 
-        # Check if conductor is busy — non-blocking via executor
-        loop = asyncio.get_running_loop()
-        conductor_status = await loop.run_in_executor(
-            None, functools.partial(get_session_status, session_title, profile=target_profile)
-        )
-        was_busy = conductor_status in ("running", "active", "starting")
-
-        log.info("User message -> [%s]: %s", target_profile, cleaned_msg[:100])
-
-        if was_busy:
-            tg_bot = message.bot
-            tg_chat_id = message.chat.id
-            profile_tag_captured = profile_tag
-            enqueued_at = time.monotonic()
-
-            async def _tg_reply(response_text: str):
-                elapsed = int(time.monotonic() - enqueued_at)
-                waited = f"{elapsed // 60}m {elapsed % 60}s" if elapsed >= 60 else f"{elapsed}s"
-                header = (
-                    f"{profile_tag_captured}Queued response (waited {waited}):\n"
-                    if profile_tag_captured
-                    else f"Queued response (waited {waited}):\n"
-                )
-                html = md_to_tg_html(f"{header}{response_text}")
-                for chunk in split_message(html):
-                    await tg_bot.send_message(tg_chat_id, chunk, parse_mode="HTML")
-
-            ok, _, _ = send_to_conductor(
-                session_title,
-                cleaned_msg,
-                profile=target_profile,
-                wait_for_reply=False,
-                reply_callback=_tg_reply,
-                force_queue=True,
-            )
-            if not ok:
-                await message.answer(
-                    f"[Failed to send message to conductor [{target_profile}].]"
+        async def _deliver():
+            # Ensure conductor is running for this profile
+            if not await ensure_conductor_running(target_conductor["name"], target_profile):
+                await reply(
+                    message,
+                    f"[Could not start conductor for {target_profile}. Check agent-deck.]"
                 )
                 return
-            await message.answer(
-                f"{profile_tag}\u23f3 Conductor busy \u2014 message queued, will reply here when done."
-            )
-            return
 
-        # Conductor is free — send and wait for reply (non-blocking via executor)
-        await message.answer(f"{profile_tag}\u23f3")  # typing indicator before blocking
-        wait_started_at = time.monotonic()
-        ok, response, still_running = await loop.run_in_executor(
-            None,
-            functools.partial(
-                send_to_conductor,
-                session_title,
-                cleaned_msg,
-                profile=target_profile,
-                wait_for_reply=True,
-                response_timeout=RESPONSE_TIMEOUT,
-            ),
-        )
-        if not ok:
-            if still_running:
-                # The message WAS delivered; the single turn just outran the
-                # blocking wait. Don't report a false failure and don't re-send
-                # (that would double-process) — watch for the reply async-ly.
-                tg_bot = message.bot
-                tg_chat_id = message.chat.id
+            # Check if conductor is busy
+            conductor_status = await get_session_status(session_title, profile=target_profile)
+            was_busy = conductor_status in ("running", "active", "starting")
+
+            log.info("User message -> [%s]: %s", target_profile, cleaned_msg[:100])
+
+            if was_busy:
                 profile_tag_captured = profile_tag
+                enqueued_at = time.monotonic()
 
-                async def _tg_late_reply(response_text: str):
-                    elapsed = int(time.monotonic() - wait_started_at)
+                async def _tg_reply(response_text: str):
+                    elapsed = int(time.monotonic() - enqueued_at)
                     waited = f"{elapsed // 60}m {elapsed % 60}s" if elapsed >= 60 else f"{elapsed}s"
                     header = (
                         f"{profile_tag_captured}Queued response (waited {waited}):\n"
@@ -1756,33 +2223,125 @@ def create_telegram_bot(config: dict):
                     )
                     html = md_to_tg_html(f"{header}{response_text}")
                     for chunk in split_message(html):
-                        await tg_bot.send_message(tg_chat_id, chunk, parse_mode="HTML")
+                        await reply(message, chunk, parse_mode="HTML")
 
-                _register_pending_reply(session_title, target_profile, _tg_late_reply)
-                await message.answer(
-                    f"{profile_tag}⏳ Still working — will reply here when done."
+                ok, _, _ = await send_to_conductor(
+                    session_title,
+                    cleaned_msg,
+                    profile=target_profile,
+                    wait_for_reply=False,
+                    reply_callback=_tg_reply,
+                )
+                if not ok:
+                    await reply(
+                        message,
+                        f"[Failed to send message to conductor [{target_profile}].]"
+                    )
+                    return
+                await reply(
+                    message,
+                    f"{profile_tag}\u23f3 Conductor busy \u2014 message queued, will reply here when done."
                 )
                 return
-            await message.answer(
-                f"[Failed to send message to conductor [{target_profile}].]"
-            )
-            return
 
-        log.info("Conductor [%s] response: %s", target_profile, response[:100])
+            async def _tg_answer(response_text: str):
+                # Convert to HTML first, then split to respect post-conversion length
+                html_response = md_to_tg_html(
+                    f"{profile_tag}{response_text}" if profile_tag else response_text
+                )
+                for chunk in split_message(html_response):
+                    await reply(message, chunk, parse_mode="HTML")
+
+            # Conductor is free — send and wait for reply. Claude conductors
+            # stream the reply so long answers start arriving right away.
+            typing = loop.create_task(_keep_typing(
+                message.bot,
+                message.chat.id,
+                message.message_thread_id if message.is_topic_message else None,
+            ))
+            wait_started_at = time.monotonic()
+            streamed = conductor_agent(target_conductor) == "claude"
+            try:
+                if streamed:
+                    ok, response, still_running = await send_to_conductor_streaming(
+                        session_title,
+                        cleaned_msg,
+                        _tg_answer,
+                        profile=target_profile,
+                        response_timeout=RESPONSE_TIMEOUT,
+                    )
+                else:
+                    ok, response, still_running = await send_to_conductor(
+                        session_title,
+                        cleaned_msg,
+                        profile=target_profile,
+                        wait_for_reply=True,
+                        response_timeout=RESPONSE_TIMEOUT,
+                    )
+            finally:
+                typing.cancel()
+            if not ok:
+                if still_running:
+                    # The message WAS delivered; the single turn just outran the
+                    # blocking wait. Don't report a false failure and don't re-send
+                    # (that would double-process) — watch for the reply async-ly.
+                    profile_tag_captured = profile_tag
+
+                    async def _tg_late_reply(response_text: str):
+                        elapsed = int(time.monotonic() - wait_started_at)
+                        waited = f"{elapsed // 60}m {elapsed % 60}s" if elapsed >= 60 else f"{elapsed}s"
+                        header = (
+                            f"{profile_tag_captured}Queued response (waited {waited}):\n"
+                            if profile_tag_captured
+                            else f"Queued response (waited {waited}):\n"
+                        )
+                        html = md_to_tg_html(f"{header}{response_text}")
+                        for chunk in split_message(html):
+                            await reply(message, chunk, parse_mode="HTML")
+
+                    # A streamed reply may already be partly in the chat.
+                    _register_pending_reply(
+                        session_title, target_profile, _tg_late_reply,
+                        already_sent=response if streamed else "",
+                    )
+                    await reply(
+                        message,
+                        f"{profile_tag}⏳ Still working — will reply here when done."
+                    )
+                    return
+                await reply(
+                    message,
+                    f"[Failed to send message to conductor [{target_profile}].]"
+                )
+                return
 
-        # Convert to HTML first, then split to respect post-conversion length
-        html_response = md_to_tg_html(
-            f"{profile_tag}{response}" if profile_tag else response
-        )
-        for chunk in split_message(html_response):
-            await message.answer(chunk, parse_mode="HTML")
-
-        # Run post-message hook (non-gating)
-        invoke_hook(target_profile, "post-message", {
-            "profile": target_profile,
-            "message_text": cleaned_msg,
-            "response": response,
-        })
+            log.info("Conductor [%s] response: %s", target_profile, response[:100])
+
+            if not streamed:
+                await _tg_answer(response)
+
+            # Run post-message hook (non-gating)
+            await loop.run_in_executor(
+                None,
+                functools.partial(invoke_hook, target_profile, "post-message", {
+                    "profile": target_profile,
+                    "message_text": cleaned_msg,
+                    "response": response,
+                }),
+            )
+
+        # Sends to one conductor are serialized; other conductors are unaffected.
+        ahead = _submit_conductor_job(session_title, target_profile, _deliver)
+        if ahead is None:
+            await reply(
+                message,
+                f"{profile_tag}[Too many messages pending for this conductor — try again shortly.]"
+            )
+        elif ahead:
+            await reply(
+                message,
+                f"{profile_tag}⏳ Still handling an earlier message — yours is queued behind it."
+            )
 
     return bot, dp
 
@@ -1792,6 +2351,26 @@ def create_telegram_bot(config: dict):
 # ---------------------------------------------------------------------------
 
 
+def _build_slack_allowlist(raw, default_role: str = "user") -> dict[str, dict]:
+    """Normalize allowed_user_ids once: strip, drop blanks, dedupe, intern.
+
+    Operator typos such as trailing whitespace are fixed here at startup so
+    the per-event check stays a single hash lookup. Each user maps to its
+    policy (currently just {"role": default_role}) so role checks can read
+    it without another pass over the config.
+    """
+    return {
+        sys.intern(u.strip()): {"role": default_role}
+        for u in raw or ()
+        if u and u.strip()
+    }
+
+
+def _slack_user_policy(allowlist: dict[str, dict], user_id: str) -> dict | None:
+    """Return the policy for user_id, or None if it is not in the allowlist."""
+    return allowlist.get(user_id)
+
+
 def create_slack_app(config: dict):
     """Create and configure the Slack app with Socket Mode.
 
@@ -1838,21 +2417,59 @@ def create_slack_app(config: dict):
     app = AsyncApp(token=bot_token, authorize=_cached_authorize)
     listen_mode = config["slack"].get("listen_mode", "mentions")
 
-    # Authorization setup
-    allowed_users = config["slack"]["allowed_user_ids"]
+    # Authorization setup. Built once so each event is a hash lookup rather
+    # than a scan of the configured list. IDs are interned so a lookup with
+    # an interned user_id settles equality by identity.
+    allowed_users = _build_slack_allowlist(
+        config["slack"]["allowed_user_ids"],
+        config["slack"].get("default_role", "user"),
+    )
+    auth_disabled = not allowed_users  # Empty allowlist = no restrictions
+
+    # Channels are dominated by a few repeat senders; remember their verdicts.
+    # Bounded so a flood of distinct user IDs can't grow it without limit.
+    @functools.lru_cache(maxsize=1024)
+    def _authz(user_id: str) -> bool:
+        return auth_disabled or user_id in allowed_users
 
     def is_slack_authorized(user_id: str) -> bool:
         """Check if Slack user is authorized to use the bot.
 
         If allowed_user_ids is empty, allow all users (backward compatible).
-        Otherwise, only allow users in the list.
+        Otherwise, only allow users in the list. Callers report rejections
+        via note_unauthorized().
         """
-        if not allowed_users:  # Empty list = no restrictions
-            return True
-        if user_id not in allowed_users:
-            log.warning("Unauthorized Slack message from user %s", user_id)
-            return False
-        return True
+        return _authz(sys.intern(user_id))
+
+    # Rejections are tallied and logged as one summary line at most every
+    # SLACK_REJECT_LOG_INTERVAL seconds, so a spamming user can't turn the
+    # log into the bottleneck. A timer logs the tally when the window closes,
+    # so the last burst is reported even if no further rejection arrives.
+    rejected: Counter[str] = Counter()
+    last_reject_flush = 0.0
+    reject_flush_timer: asyncio.TimerHandle | None = None
+
+    def _flush_rejected() -> None:
+        nonlocal last_reject_flush, reject_flush_timer
+        if reject_flush_timer is not None:
+            reject_flush_timer.cancel()
+            reject_flush_timer = None
+        if rejected:
+            log.warning("Unauthorized Slack messages: %s", dict(rejected))
+            rejected.clear()
+        last_reject_flush = time.monotonic()
+
+    def note_unauthorized(user_id: str) -> None:
+        """Record a rejected Slack user for the rate-limited warning."""
+        nonlocal reject_flush_timer
+        rejected[user_id] += 1
+        wait = last_reject_flush + SLACK_REJECT_LOG_INTERVAL - time.monotonic()
+        if wait <= 0:
+            _flush_rejected()
+        elif reject_flush_timer is None:
+            reject_flush_timer = asyncio.get_running_loop().call_later(
+                wait, _flush_rejected,
+            )
 
     # Caches for Slack user/channel name resolution.
     # Entries: (value: str, expires_at: float | None).
@@ -2014,80 +2631,29 @@ def create_slack_app(config: dict):
         session_title = conductor_session_title(target["name"])
         profile = target["profile"]
 
-        if not await ensure_conductor_running(target["name"], profile):
-            await _safe_say(
-                say,
-                text=f"[Could not start conductor {target['name']}. Check agent-deck.]",
-                thread_ts=thread_ts,
-            )
-            return
-
-        # Check if conductor is busy — non-blocking via executor
-        loop = asyncio.get_running_loop()
-        conductor_status = await loop.run_in_executor(
-            None, functools.partial(get_session_status, session_title, profile=profile)
-        )
-        was_busy = conductor_status in ("running", "active", "starting")
-
-        log.info("Slack message -> [%s]: %s", target["name"], cleaned_msg[:100])
-
         name_tag = f"[{target['name']}] " if len(conductors) > 1 else ""
 
-        if was_busy:
-            name_tag_captured = name_tag
-            enqueued_at = time.monotonic()
-
-            async def _slack_reply(response_text: str):
-                elapsed = int(time.monotonic() - enqueued_at)
-                waited = f"{elapsed // 60}m {elapsed % 60}s" if elapsed >= 60 else f"{elapsed}s"
-                header = (
-                    f"{name_tag_captured}Queued response (waited {waited}):\n"
-                    if name_tag_captured
-                    else f"Queued response (waited {waited}):\n"
-                )
-                chunks = split_message(response_text, max_len=SLACK_MAX_LENGTH)
-                for i, chunk in enumerate(chunks):
-                    text = f"{header}{chunk}" if i == 0 else chunk
-                    await _safe_say(say, text=text, thread_ts=thread_ts)
-
-            ok, _, _ = send_to_conductor(
-                session_title, cleaned_msg, profile=profile,
-                wait_for_reply=False, reply_callback=_slack_reply,
-                force_queue=True,
-            )
-            if not ok:
+        async def _deliver():
+            if not await ensure_conductor_running(target["name"], profile):
                 await _safe_say(
                     say,
-                    text=f"[Failed to send message to conductor {target['name']}.]",
+                    text=f"[Could not start conductor {target['name']}. Check agent-deck.]",
                     thread_ts=thread_ts,
                 )
                 return
-            await _safe_say(
-                say,
-                text=f"{name_tag}\u23f3 Conductor busy \u2014 message queued, will reply here when done.",
-                thread_ts=thread_ts,
-            )
-            return
 
-        await _safe_say(say, text=f"{name_tag}\u23f3", thread_ts=thread_ts)  # before blocking
-        wait_started_at = time.monotonic()
-        ok, response, still_running = await loop.run_in_executor(
-            None,
-            functools.partial(
-                send_to_conductor,
-                session_title, cleaned_msg, profile=profile,
-                wait_for_reply=True, response_timeout=RESPONSE_TIMEOUT,
-            ),
-        )
-        if not ok:
-            if still_running:
-                # The message WAS delivered; the single turn just outran the
-                # blocking wait. Don't report a false failure and don't re-send
-                # (that would double-process) \u2014 watch for the reply async-ly.
+            # Check if conductor is busy
+            conductor_status = await get_session_status(session_title, profile=profile)
+            was_busy = conductor_status in ("running", "active", "starting")
+
+            log.info("Slack message -> [%s]: %s", target["name"], cleaned_msg[:100])
+
+            if was_busy:
                 name_tag_captured = name_tag
+                enqueued_at = time.monotonic()
 
-                async def _slack_late_reply(response_text: str):
-                    elapsed = int(time.monotonic() - wait_started_at)
+                async def _slack_reply(response_text: str):
+                    elapsed = int(time.monotonic() - enqueued_at)
                     waited = f"{elapsed // 60}m {elapsed % 60}s" if elapsed >= 60 else f"{elapsed}s"
                     header = (
                         f"{name_tag_captured}Queued response (waited {waited}):\n"
@@ -2099,25 +2665,84 @@ def create_slack_app(config: dict):
                         text = f"{header}{chunk}" if i == 0 else chunk
                         await _safe_say(say, text=text, thread_ts=thread_ts)
 
-                _register_pending_reply(session_title, profile, _slack_late_reply)
+                ok, _, _ = await send_to_conductor(
+                    session_title, cleaned_msg, profile=profile,
+                    wait_for_reply=False, reply_callback=_slack_reply,
+                )
+                if not ok:
+                    await _safe_say(
+                        say,
+                        text=f"[Failed to send message to conductor {target['name']}.]",
+                        thread_ts=thread_ts,
+                    )
+                    return
+                await _safe_say(
+                    say,
+                    text=f"{name_tag}\u23f3 Conductor busy \u2014 message queued, will reply here when done.",
+                    thread_ts=thread_ts,
+                )
+                return
+
+            await _safe_say(say, text=f"{name_tag}\u23f3", thread_ts=thread_ts)  # before waiting
+            wait_started_at = time.monotonic()
+            ok, response, still_running = await send_to_conductor(
+                session_title, cleaned_msg, profile=profile,
+                wait_for_reply=True, response_timeout=RESPONSE_TIMEOUT,
+            )
+            if not ok:
+                if still_running:
+                    # The message WAS delivered; the single turn just outran the
+                    # blocking wait. Don't report a false failure and don't re-send
+                    # (that would double-process) \u2014 watch for the reply async-ly.
+                    name_tag_captured = name_tag
+
+                    async def _slack_late_reply(response_text: str):
+                        elapsed = int(time.monotonic() - wait_started_at)
+                        waited = f"{elapsed // 60}m {elapsed % 60}s" if elapsed >= 60 else f"{elapsed}s"
+                        header = (
+                            f"{name_tag_captured}Queued response (waited {waited}):\n"
+                            if name_tag_captured
+                            else f"Queued response (waited {waited}):\n"
+                        )
+                        chunks = split_message(response_text, max_len=SLACK_MAX_LENGTH)
+                        for i, chunk in enumerate(chunks):
+                            text = f"{header}{chunk}" if i == 0 else chunk
+                            await _safe_say(say, text=text, thread_ts=thread_ts)
+
+                    _register_pending_reply(session_title, profile, _slack_late_reply)
+                    await _safe_say(
+                        say,
+                        text=f"{name_tag}\u23f3 Still working \u2014 will reply here when done.",
+                        thread_ts=thread_ts,
+                    )
+                    return
                 await _safe_say(
                     say,
-                    text=f"{name_tag}\u23f3 Still working \u2014 will reply here when done.",
+                    text=f"[Failed to send message to conductor {target['name']}.]",
                     thread_ts=thread_ts,
                 )
                 return
+
+            log.info("Conductor [%s] response: %s", target["name"], response[:100])
+
+            for chunk in split_message(response, max_len=SLACK_MAX_LENGTH):
+                prefixed = f"{name_tag}{chunk}" if name_tag else chunk
+                await _safe_say(say, text=prefixed, thread_ts=thread_ts)
+
+        # Sends to one conductor are serialized; other conductors are unaffected.
+        ahead = _submit_conductor_job(session_title, profile, _deliver)
+        if ahead is None:
             await _safe_say(
                 say,
-                text=f"[Failed to send message to conductor {target['name']}.]",
+                text=f"{name_tag}[Too many messages pending for this conductor \u2014 try again shortly.]",
+                thread_ts=thread_ts,
+            )
+        elif ahead:
+            await _safe_say(
+                say,
+                text=f"{name_tag}\u23f3 Still handling an earlier message \u2014 yours is queued behind it.",
                 thread_ts=thread_ts,
             )
-            return
-
-        log.info("Conductor [%s] response: %s", target["name"], response[:100])
-
-        for chunk in split_message(response, max_len=SLACK_MAX_LENGTH):
-            prefixed = f"{name_tag}{chunk}" if name_tag else chunk
-            await _safe_say(say, text=prefixed, thread_ts=thread_ts)
 
     @app.event("message")
     async def handle_slack_message(event, say):
@@ -2137,6 +2762,7 @@ def create_slack_app(config: dict):
         # Authorization check
         user_id = event.get("user", "")
         if not is_slack_authorized(user_id):
+            note_unauthorized(user_id)
             return
 
         text = event.get("text", "").strip()
@@ -2155,6 +2781,7 @@ def create_slack_app(config: dict):
         # Authorization check
         user_id = event.get("user", "")
         if not is_slack_authorized(user_id):
+            note_unauthorized(user_id)
             return
 
         text = event.get("text", "")
@@ -2177,11 +2804,12 @@ def create_slack_app(config: dict):
         # Authorization check
         user_id = command.get("user_id", "")
         if not is_slack_authorized(user_id):
+            note_unauthorized(user_id)
             await respond("⛔ Unauthorized. Contact your administrator.")
             return
 
         profiles = get_unique_profiles()
-        agg = get_status_summary_all(profiles)
+        agg = await get_status_summary_all(profiles)
         totals = agg["totals"]
 
         lines = [
@@ -2211,11 +2839,12 @@ def create_slack_app(config: dict):
         # Authorization check
         user_id = command.get("user_id", "")
         if not is_slack_authorized(user_id):
+            note_unauthorized(user_id)
             await respond("⛔ Unauthorized. Contact your administrator.")
             return
 
         profiles = get_unique_profiles()
-        all_sessions = get_sessions_list_all(profiles)
+        all_sessions = await get_sessions_list_all(profiles)
         if not all_sessions:
             await respond("No sessions found.")
             return
@@ -2238,6 +2867,7 @@ def create_slack_app(config: dict):
         # Authorization check
         user_id = command.get("user_id", "")
         if not is_slack_authorized(user_id):
+            note_unauthorized(user_id)
             await respond("⛔ Unauthorized. Contact your administrator.")
             return
 
@@ -2259,10 +2889,11 @@ def create_slack_app(config: dict):
 
         session_title = conductor_session_title(target["name"])
         await respond(f"Restarting conductor {target['name']}...")
-        result = run_cli(
+        result = await run_cli(
             "session", "restart", session_title,
             profile=target["profile"], timeout=60,
         )
+        _invalidate_session_status(session_title, target["profile"])
         if result.returncode == 0:
             await respond(f"Conductor {target['name']} restarted.")
         else:
@@ -2276,6 +2907,7 @@ def create_slack_app(config: dict):
         # Authorization check
         user_id = command.get("user_id", "")
         if not is_slack_authorized(user_id):
+            note_unauthorized(user_id)
             await respond("⛔ Unauthorized. Contact your administrator.")
             return
 
@@ -2448,7 +3080,7 @@ def create_discord_bot(config: dict):
             return
 
         profiles = get_unique_profiles()
-        agg = get_status_summary_all(profiles)
+        agg = await get_status_summary_all(profiles)
         totals = agg["totals"]
 
         lines = [
@@ -2485,7 +3117,7 @@ def create_discord_bot(config: dict):
             return
 
         profiles = get_unique_profiles()
-        all_sessions = get_sessions_list_all(profiles)
+        all_sessions = await get_sessions_list_all(profiles)
         if not all_sessions:
             await interaction.response.send_message("No sessions found.")
             return
@@ -2549,10 +3181,11 @@ def create_discord_bot(config: dict):
             f"Restarting conductor {target['name']}...",
         )
 
-        result = run_cli(
+        result = await run_cli(
             "session", "restart", session_title,
             profile=target["profile"], timeout=60,
         )
+        _invalidate_session_status(session_title, target["profile"])
         if result.returncode == 0:
             await interaction.followup.send(
                 f"Conductor {target['name']} restarted.",
@@ -2650,63 +3283,72 @@ def create_discord_bot(config: dict):
         session_title = conductor_session_title(target["name"])
         profile = target["profile"]
 
-        if not await ensure_conductor_running(target["name"], profile):
-            await message.channel.send(
-                f"[Could not start conductor {target['name']}. Check agent-deck.]",
-            )
-            return
-
-        log.info(
-            "Discord message -> [%s]: %s",
-            target["name"], cleaned_msg[:100],
+        name_tag = (
+            f"[{target['name']}] " if len(conductors) > 1 else ""
         )
-        async with message.channel.typing():
-            loop = asyncio.get_event_loop()
-            ok, response, still_running = await loop.run_in_executor(
-                None,
-                lambda: send_to_conductor(
+
+        async def _deliver():
+            if not await ensure_conductor_running(target["name"], profile):
+                await message.channel.send(
+                    f"[Could not start conductor {target['name']}. Check agent-deck.]",
+                )
+                return
+
+            log.info(
+                "Discord message -> [%s]: %s",
+                target["name"], cleaned_msg[:100],
+            )
+            async with message.channel.typing():
+                ok, response, still_running = await send_to_conductor(
                     session_title,
                     cleaned_msg,
                     profile=profile,
                     wait_for_reply=True,
                     response_timeout=RESPONSE_TIMEOUT,
-                ),
-            )
-        if not ok:
-            if still_running:
-                # The message WAS delivered; the single turn just outran the
-                # blocking wait. Don't report a false failure and don't re-send
-                # (that would double-process) — watch for the reply async-ly.
-                # Mirrors the Telegram/Slack idle paths (#1404).
-                dc_channel = message.channel
-                dc_name_tag = (
-                    f"[{target['name']}] " if len(conductors) > 1 else ""
                 )
-
-                async def _dc_late_reply(response_text: str):
-                    await send_discord_output(
-                        dc_channel, response_text, name_tag=dc_name_tag,
+            if not ok:
+                if still_running:
+                    # The message WAS delivered; the single turn just outran the
+                    # blocking wait. Don't report a false failure and don't re-send
+                    # (that would double-process) — watch for the reply async-ly.
+                    # Mirrors the Telegram/Slack idle paths (#1404).
+                    dc_channel = message.channel
+                    dc_name_tag = (
+                        f"[{target['name']}] " if len(conductors) > 1 else ""
                     )
 
-                _register_pending_reply(session_title, profile, _dc_late_reply)
+                    async def _dc_late_reply(response_text: str):
+                        await send_discord_output(
+                            dc_channel, response_text, name_tag=dc_name_tag,
+                        )
+
+                    _register_pending_reply(session_title, profile, _dc_late_reply)
+                    await message.channel.send(
+                        "⏳ Still working — will reply here when done.",
+                    )
+                    return
                 await message.channel.send(
-                    "⏳ Still working — will reply here when done.",
+                    f"[Failed to send message to conductor {target['name']}.]",
                 )
                 return
-            await message.channel.send(
-                f"[Failed to send message to conductor {target['name']}.]",
+
+            log.info(
+                "Conductor [%s] response: %s",
+                target["name"], response[:100],
             )
-            return
 
-        log.info(
-            "Conductor [%s] response: %s",
-            target["name"], response[:100],
-        )
+            await send_discord_output(message.channel, response, name_tag=name_tag)
 
-        name_tag = (
-            f"[{target['name']}] " if len(conductors) > 1 else ""
-        )
-        await send_discord_output(message.channel, response, name_tag=name_tag)
+        # Sends to one conductor are serialized; other conductors are unaffected.
+        ahead = _submit_conductor_job(session_title, profile, _deliver)
+        if ahead is None:
+            await message.channel.send(
+                f"{name_tag}[Too many messages pending for this conductor — try again shortly.]",
+            )
+        elif ahead:
+            await message.channel.send(
+                f"{name_tag}⏳ Still handling an earlier message — yours is queued behind it.",
+            )
 
     log.info(
         "Discord bot initialized (guild=%d, channel=%d)",
@@ -2763,96 +3405,142 @@ async def heartbeat_loop(
     # firing the same alert verbatim for 12+ hours.
     need_state_by_conductor: dict[str, dict] = {}
 
-    log.info("Heartbeat loop started (global interval: %d minutes)", global_interval)
-
-    while True:
-        await asyncio.sleep(interval_seconds)
+    async def _notify_alerts(alerts: list[str]) -> None:
+        """Deliver one tick's conductor alerts as a single notification."""
+        alert_msg = "\n\n".join(alerts)
 
-        all_conductors = discover_conductors()
-        conductors = select_heartbeat_conductors(all_conductors)
-        for conductor in conductors:
+        # Notify via Telegram (with HTML formatting)
+        if telegram_bot and tg_user_id:
             try:
-                name = conductor.get("name", "")
-                profile = conductor.get("profile") or "default"
-                if not name:
-                    continue
+                alert_html = md_to_tg_html(alert_msg)
+                sender = get_telegram_sender(telegram_bot)
+                for chunk in split_message(alert_html):
+                    await sender.send(
+                        tg_user_id,
+                        chunk,
+                        parse_mode="HTML",
+                    )
+            except Exception as e:
+                log.error(
+                    "Failed to send Telegram notification: %s", e
+                )
 
-                session_title = conductor_session_title(name)
-
-                # Scope heartbeat monitoring to this conductor's own group
-                # (mirrors the deployed bridge: per-conductor, not profile-wide).
-                sessions = get_sessions_list(profile)
-                scoped_sessions = []
-                for s in sessions:
-                    s_title = s.get("title", "untitled")
-                    s_group = s.get("group", "") or ""
-                    if s_title.startswith("conductor-"):
-                        continue
-                    if s_group != name and not s_group.startswith(f"{name}/"):
-                        continue
-                    scoped_sessions.append(s)
-
-                waiting = sum(1 for s in scoped_sessions if s.get("status", "") == "waiting")
-                running = sum(1 for s in scoped_sessions if s.get("status", "") == "running")
-                idle = sum(1 for s in scoped_sessions if s.get("status", "") == "idle")
-                error = sum(1 for s in scoped_sessions if s.get("status", "") == "error")
-                stopped = sum(1 for s in scoped_sessions if s.get("status", "") == "stopped")
+        # Notify via Slack
+        if slack_app and slack_channel_id:
+            try:
+                await slack_app.client.chat_postMessage(
+                    channel=slack_channel_id, text=alert_msg,
+                )
+            except Exception as e:
+                log.error(
+                    "Failed to send Slack notification: %s", e
+                )
 
-                log.info(
-                    "Heartbeat [%s/%s]: %d waiting, %d running, %d idle, %d error, %d stopped",
-                    name, profile, waiting, running, idle, error, stopped,
+        # Notify via Discord
+        if discord_bot and discord_channel_id:
+            try:
+                channel = discord_bot.get_channel(discord_channel_id)
+                if channel:
+                    await send_discord_output(channel, alert_msg)
+            except Exception as e:
+                log.error(
+                    "Failed to send Discord notification: %s", e
                 )
 
-                # Only trigger conductor if there are waiting or error sessions
-                if waiting == 0 and error == 0:
+    async def _heartbeat_one(
+        conductor: dict,
+        sessions_by_profile: dict[str, list],
+        multi_conductor: bool,
+        alerts: list[str],
+    ) -> None:
+        """Heartbeat one conductor; errors are logged, never raised."""
+        try:
+            name = conductor.get("name", "")
+            profile = conductor.get("profile") or "default"
+            if not name:
+                return
+
+            session_title = conductor_session_title(name)
+
+            # Scope heartbeat monitoring to this conductor's own group
+            # (mirrors the deployed bridge: per-conductor, not profile-wide).
+            sessions = sessions_by_profile.get(profile, [])
+            # One pass over the snapshot: scope, tally and collect the
+            # waiting/error details the heartbeat message needs.
+            scoped_sessions = []
+            counts = {"waiting": 0, "running": 0, "idle": 0, "error": 0, "stopped": 0}
+            waiting_details = []
+            error_details = []
+            group_prefix = f"{name}/"
+            for s in sessions:
+                s_title = s.get("title", "untitled")
+                s_group = s.get("group", "") or ""
+                if s_title.startswith("conductor-"):
+                    continue
+                if s_group != name and not s_group.startswith(group_prefix):
                     continue
+                scoped_sessions.append(s)
+                s_status = s.get("status", "")
+                if s_status in counts:
+                    counts[s_status] += 1
+                if s_status == "waiting":
+                    waiting_details.append(f"{s_title} (project: {s.get('path', '')})")
+                elif s_status == "error":
+                    error_details.append(f"{s_title} (project: {s.get('path', '')})")
+
+            waiting = counts["waiting"]
+            running = counts["running"]
+            idle = counts["idle"]
+            error = counts["error"]
+            stopped = counts["stopped"]
 
-                # Build heartbeat message with waiting/error session details
-                waiting_details = []
-                error_details = []
-                for s in scoped_sessions:
-                    s_title = s.get("title", "untitled")
-                    s_status = s.get("status", "")
-                    s_path = s.get("path", "")
-                    if s_status == "waiting":
-                        waiting_details.append(f"{s_title} (project: {s_path})")
-                    elif s_status == "error":
-                        error_details.append(f"{s_title} (project: {s_path})")
-
-                parts = [
-                    f"[HEARTBEAT] [{name}] Status: {waiting} waiting, "
-                    f"{running} running, {idle} idle, {error} error, {stopped} stopped."
-                ]
-                if waiting_details:
-                    parts.append(f"Waiting sessions: {', '.join(waiting_details)}.")
-                if error_details:
-                    parts.append(f"Error sessions: {', '.join(error_details)}.")
-                # Append HEARTBEAT_RULES.md (per-conductor, per-profile, then global fallback)
-                rules_text = None
-                for rules_path in [
-                    CONDUCTOR_DIR / name / "HEARTBEAT_RULES.md",
-                    CONDUCTOR_DIR / profile / "HEARTBEAT_RULES.md",
-                    CONDUCTOR_DIR / "HEARTBEAT_RULES.md",
-                ]:
-                    if rules_path.exists():
-                        try:
-                            rules_text = rules_path.read_text().strip()
-                        except Exception as e:
-                            log.warning("Failed to read %s: %s", rules_path, e)
-                        break
-                if rules_text:
-                    parts.append(f"\n\n{rules_text}")
-                else:
-                    parts.append("Check if any need auto-response or user attention.")
+            log.info(
+                "Heartbeat [%s/%s]: %d waiting, %d running, %d idle, %d error, %d stopped",
+                name, profile, waiting, running, idle, error, stopped,
+            )
+
+            # Only trigger conductor if there are waiting or error sessions
+            if waiting == 0 and error == 0:
+                return
+
+            # Build heartbeat message with waiting/error session details
+            parts = [
+                f"[HEARTBEAT] [{name}] Status: {waiting} waiting, "
+                f"{running} running, {idle} idle, {error} error, {stopped} stopped."
+            ]
+            if waiting_details:
+                parts.append(f"Waiting sessions: {', '.join(waiting_details)}.")
+            if error_details:
+                parts.append(f"Error sessions: {', '.join(error_details)}.")
+            # Append HEARTBEAT_RULES.md (per-conductor, per-profile, then global fallback)
+            rules_text = None
+            for rules_path in [
+                CONDUCTOR_DIR / name / "HEARTBEAT_RULES.md",
+                CONDUCTOR_DIR / profile / "HEARTBEAT_RULES.md",
+                CONDUCTOR_DIR / "HEARTBEAT_RULES.md",
+            ]:
+                if rules_path.exists():
+                    try:
+                        rules_text = rules_path.read_text().strip()
+                    except Exception as e:
+                        log.warning("Failed to read %s: %s", rules_path, e)
+                    break
+            if rules_text:
+                parts.append(f"\n\n{rules_text}")
+            else:
+                parts.append("Check if any need auto-response or user attention.")
 
-                heartbeat_msg = " ".join(parts)
+            heartbeat_msg = " ".join(parts)
 
-                # Run pre-heartbeat hook (can transform or gate the message)
-                sessions_for_hook = [
-                    {"title": s.get("title", ""), "status": s.get("status", ""), "path": s.get("path", "")}
-                    for s in scoped_sessions
-                ]
-                hook_result = invoke_hook(profile, "pre-heartbeat", {
+            # Run pre-heartbeat hook (can transform or gate the message)
+            sessions_for_hook = [
+                {"title": s.get("title", ""), "status": s.get("status", ""), "path": s.get("path", "")}
+                for s in scoped_sessions
+            ]
+            loop = asyncio.get_running_loop()
+            hook_result = await loop.run_in_executor(
+                None,
+                functools.partial(invoke_hook, profile, "pre-heartbeat", {
                     "profile": profile,
                     "waiting": waiting,
                     "running": running,
@@ -2860,136 +3548,131 @@ async def heartbeat_loop(
                     "error": error,
                     "sessions": sessions_for_hook,
                     "draft_message": heartbeat_msg,
-                })
-                if hook_result is not None:
-                    success, stdout = hook_result
-                    if not success:
-                        log.info("Heartbeat [%s]: gated by pre-heartbeat hook", name)
-                        continue
-                    if stdout:
-                        heartbeat_msg = stdout
-
-                # Ensure conductor is running for this profile
-                if not await ensure_conductor_running(name, profile):
-                    log.error(
-                        "Heartbeat [%s]: conductor not running, skipping",
-                        name,
-                    )
-                    continue
-
-                # Check if conductor is busy — skip heartbeat if so
-                # (heartbeats are periodic; no point queueing them)
-                loop = asyncio.get_running_loop()
-                conductor_status = await loop.run_in_executor(
-                    None,
-                    functools.partial(get_session_status, session_title, profile=profile),
+                }),
+            )
+            if hook_result is not None:
+                success, stdout = hook_result
+                if not success:
+                    log.info("Heartbeat [%s]: gated by pre-heartbeat hook", name)
+                    return
+                if stdout:
+                    heartbeat_msg = stdout
+
+            # Ensure conductor is running for this profile
+            if not await ensure_conductor_running(name, profile):
+                log.error(
+                    "Heartbeat [%s]: conductor not running, skipping",
+                    name,
                 )
-                if conductor_status in ("running", "active", "starting"):
-                    log.info(
-                        "Heartbeat [%s]: conductor busy (%s), skipping this cycle",
-                        name, conductor_status,
-                    )
-                    continue
+                return
 
-                # Send heartbeat to conductor (wrapped in executor — blocks up to
-                # RESPONSE_TIMEOUT seconds and must not freeze the event loop)
-                ok, response, _ = await loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        send_to_conductor,
-                        session_title,
-                        heartbeat_msg,
-                        profile=profile,
-                        wait_for_reply=True,
-                        response_timeout=RESPONSE_TIMEOUT,
-                    ),
+            # Check if conductor is busy — skip heartbeat if so
+            # (heartbeats are periodic; no point queueing them)
+            conductor_status = await get_session_status(
+                session_title, profile=profile
+            )
+            if conductor_status in ("running", "active", "starting"):
+                log.info(
+                    "Heartbeat [%s]: conductor busy (%s), skipping this cycle",
+                    name, conductor_status,
                 )
-                if not ok:
-                    log.error(
-                        "Heartbeat [%s]: failed to send to conductor",
-                        name,
-                    )
-                    continue
+                return
 
-                # Response is captured via get_session_output (see send_to_conductor).
-                log.info(
-                    "Heartbeat [%s] response: %s",
-                    name, response[:200],
+            # Send heartbeat to conductor (waits up to RESPONSE_TIMEOUT
+            # seconds; the subprocess is awaited so the loop stays free)
+            ok, response, _ = await send_to_conductor(
+                session_title,
+                heartbeat_msg,
+                profile=profile,
+                wait_for_reply=True,
+                response_timeout=RESPONSE_TIMEOUT,
+            )
+            if not ok:
+                log.error(
+                    "Heartbeat [%s]: failed to send to conductor",
+                    name,
                 )
+                return
+
+            # Response is captured via get_session_output (see send_to_conductor).
+            log.info(
+                "Heartbeat [%s] response: %s",
+                name, response[:200],
+            )
 
-                # Dedup repeating NEED: lines (issue #971). Forward only
-                # fresh + escalation lines; drop verbatim repeats past
-                # threshold so the user isn't trained to ignore heartbeats.
-                prev_counts = need_state_by_conductor.get(name, {})
-                need_filtered = filter_need_lines(response, prev_counts)
-                need_state_by_conductor[name] = need_filtered["counts"]
+            # Dedup repeating NEED: lines (issue #971). Forward only
+            # fresh + escalation lines; drop verbatim repeats past
+            # threshold so the user isn't trained to ignore heartbeats.
+            prev_counts = need_state_by_conductor.get(name, {})
+            need_filtered = filter_need_lines(response, prev_counts)
+            need_state_by_conductor[name] = need_filtered["counts"]
 
-                forwarded_need_lines = (
-                    need_filtered["alerts"] + need_filtered["retired"]
+            forwarded_need_lines = (
+                need_filtered["alerts"] + need_filtered["retired"]
+            )
+            has_alerts = bool(forwarded_need_lines)
+            if need_filtered["retired"]:
+                log.info(
+                    "Heartbeat [%s]: retiring %d stale NEED line(s) "
+                    "after >= %d cycles: %s",
+                    name,
+                    len(need_filtered["retired"]),
+                    NEED_RETIRE_THRESHOLD,
+                    need_filtered["retired"],
                 )
-                has_alerts = bool(forwarded_need_lines)
-                if need_filtered["retired"]:
-                    log.info(
-                        "Heartbeat [%s]: retiring %d stale NEED line(s) "
-                        "after >= %d cycles: %s",
-                        name,
-                        len(need_filtered["retired"]),
-                        NEED_RETIRE_THRESHOLD,
-                        need_filtered["retired"],
-                    )
-                if has_alerts:
-                    prefix = (
-                        f"[{name}] " if len(all_conductors) > 1 else ""
-                    )
-                    alert_body = "\n".join(forwarded_need_lines)
-                    alert_msg = f"{prefix}Conductor alert:\n{alert_body}"
-
-                    # Notify via Telegram (with HTML formatting)
-                    if telegram_bot and tg_user_id:
-                        try:
-                            alert_html = md_to_tg_html(alert_msg)
-                            for chunk in split_message(alert_html):
-                                await telegram_bot.send_message(
-                                    tg_user_id,
-                                    chunk,
-                                    parse_mode="HTML",
-                                )
-                        except Exception as e:
-                            log.error(
-                                "Failed to send Telegram notification: %s", e
-                            )
-
-                    # Notify via Slack
-                    if slack_app and slack_channel_id:
-                        try:
-                            await slack_app.client.chat_postMessage(
-                                channel=slack_channel_id, text=alert_msg,
-                            )
-                        except Exception as e:
-                            log.error(
-                                "Failed to send Slack notification: %s", e
-                            )
-
-                    # Notify via Discord
-                    if discord_bot and discord_channel_id:
-                        try:
-                            channel = discord_bot.get_channel(discord_channel_id)
-                            if channel:
-                                await send_discord_output(channel, alert_msg)
-                        except Exception as e:
-                            log.error(
-                                "Failed to send Discord notification: %s", e
-                            )
-
-                # Run post-heartbeat hook (non-gating)
-                invoke_hook(profile, "post-heartbeat", {
+            if has_alerts:
+                prefix = (
+                    f"[{name}] " if multi_conductor else ""
+                )
+                alert_body = "\n".join(forwarded_need_lines)
+                # Sent once per tick, merged with the other conductors' alerts.
+                alerts.append(f"{prefix}Conductor alert:\n{alert_body}")
+
+            # Run post-heartbeat hook (non-gating)
+            await loop.run_in_executor(
+                None,
+                functools.partial(invoke_hook, profile, "post-heartbeat", {
                     "profile": profile,
                     "response": response,
                     "has_alerts": has_alerts,
-                })
+                }),
+            )
 
-            except Exception as e:
-                log.error("Heartbeat [%s] error: %s", conductor.get("name", "?"), e)
+        except Exception as e:
+            log.error("Heartbeat [%s] error: %s", conductor.get("name", "?"), e)
+
+    log.info("Heartbeat loop started (global interval: %d minutes)", global_interval)
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+
+        all_conductors = discover_conductors()
+        conductors = select_heartbeat_conductors(all_conductors)
+
+        # One `list --json` per profile for the whole tick, fetched
+        # concurrently, instead of one per conductor: conductors sharing a
+        # profile all scope the same snapshot below.
+        tick_profiles = sorted({
+            c.get("profile") or "default" for c in conductors if c.get("name")
+        })
+        try:
+            sessions_by_profile = await get_sessions_by_profile(tick_profiles)
+        except Exception as e:
+            log.error("Heartbeat: failed to list sessions: %s", e)
+            continue
+
+        # Conductors are independent: a slow conductor (up to
+        # RESPONSE_TIMEOUT per send) must not hold up the rest of the tick.
+        alerts: list[str] = []
+        await asyncio.gather(
+            *(
+                _heartbeat_one(c, sessions_by_profile, len(all_conductors) > 1, alerts)
+                for c in conductors
+            ),
+            return_exceptions=True,
+        )
+        if alerts:
+            await _notify_alerts(alerts)
 
 
 # ---------------------------------------------------------------------------
@@ -3022,8 +3705,10 @@ async def _run_platform_task(
 
 
 async def main():
+    global MAX_CONCURRENT_CLI
     log.info("Loading config from %s", CONFIG_PATH)
     config = load_config()
+    MAX_CONCURRENT_CLI = max(1, config["max_concurrent_cli"])
 
     conductors = discover_conductors()
     conductor_names = [c["name"] for c in conductors]
@@ -3134,4 +3819,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    # launchd/systemd stop the bridge with SIGTERM, whose default action skips
+    # atexit. Exit normally instead so _log_listener flushes queued records.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     asyncio.run(main())
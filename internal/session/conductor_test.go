@@ -517,20 +517,20 @@ func TestBridgeTemplate_ContainsSlackAuthorization(t *testing.T) {
 	}
 
 	// Check for allowed_users setup
-	if !strings.Contains(template, `allowed_users = config["slack"]["allowed_user_ids"]`) {
+	if !strings.Contains(template, `allowed_users = _build_slack_allowlist(`) {
 		t.Error("template should load allowed_user_ids from config")
 	}
 
 	// Check for authorization logic
-	if !strings.Contains(template, "if not allowed_users:") {
+	if !strings.Contains(template, "auth_disabled = not allowed_users") {
 		t.Error("template should check if allowed_users is empty")
 	}
-	if !strings.Contains(template, "if user_id not in allowed_users:") {
+	if !strings.Contains(template, "return auth_disabled or user_id in allowed_users") {
 		t.Error("template should check if user_id is in allowed_users")
 	}
 
 	// Check for warning log
-	if !strings.Contains(template, `log.warning("Unauthorized Slack message from user %s", user_id)`) {
+	if !strings.Contains(template, `log.warning("Unauthorized Slack messages: %s", dict(rejected))`) {
 		t.Error("template should log warning for unauthorized users")
 	}
 
@@ -539,6 +539,7 @@ func TestBridgeTemplate_ContainsSlackAuthorization(t *testing.T) {
 		"user_id = event.get(\"user\", \"\")",                            // message/mention handlers
 		"user_id = command.get(\"user_id\", \"\")",                       // slash command handlers
 		"if not is_slack_authorized(user_id):",                           // authorization check
+		"note_unauthorized(user_id)",                                     // rejection logging
 		"await respond(\"⛔ Unauthorized. Contact your administrator.\")", // slash command error
 	}
 
@@ -595,8 +596,8 @@ func TestBridgeTemplate_HeartbeatScopesToConductorGroups(t *testing.T) {
 		"def select_heartbeat_conductors(conductors: list[dict]) -> list[dict]:",
 		"conductors = select_heartbeat_conductors(all_conductors)",
 		`s_group = s.get("group", "") or ""`,
-		`if s_group != name and not s_group.startswith(f"{name}/"):`,
-		`for s in scoped_sessions:`,
+		`if s_group != name and not s_group.startswith(group_prefix):`,
+		`for s in scoped_sessions`,
 	}
 
 	for _, pattern := range patterns {
@@ -615,8 +616,8 @@ func TestBridgeTemplate_SendToConductorSupportsSingleCallWait(t *testing.T) {
 	if !strings.Contains(template, waitPattern) {
 		t.Fatalf("template should include --wait send path: %q", waitPattern)
 	}
-	if !strings.Contains(template, noWaitPattern) {
-		t.Fatalf("template should retain --no-wait send path: %q", noWaitPattern)
+	if strings.Contains(template, noWaitPattern) {
+		t.Fatalf("template should not reintroduce the --no-wait send path: %q", noWaitPattern)
 	}
 	if strings.Contains(template, oldPattern) {
 		t.Fatalf("template should not contain blocking send pattern: %q", oldPattern)
@@ -2330,11 +2331,16 @@ func TestBridgeTemplate_DiscordInMain(t *testing.T) {
 
 func TestBridgeTemplate_DiscordTypingIndicator(t *testing.T) {
 	template := conductorBridgePy
-	if !strings.Contains(template, "async with message.channel.typing():") {
-		t.Error("Discord on_message should show typing indicator while waiting for conductor response")
-	}
-	if !strings.Contains(template, "run_in_executor") {
-		t.Error("Discord on_message should offload blocking send_to_conductor to thread executor")
+	typingBlock := "async with message.channel.typing():"
+	i := strings.Index(template, typingBlock)
+	if i < 0 {
+		t.Fatal("Discord on_message should show typing indicator while waiting for conductor response")
+	}
+	// The send is awaited inside the typing block, so the indicator lasts
+	// exactly as long as the conductor takes to reply.
+	body := strings.TrimLeft(template[i+len(typingBlock):], " \n")
+	if !strings.HasPrefix(body, "ok, response, still_running = await send_to_conductor(") {
+		t.Error("Discord on_message should await send_to_conductor inside the typing() block")
 	}
 }
 
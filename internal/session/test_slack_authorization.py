@@ -7,141 +7,178 @@ bridge.py script. It verifies that the is_slack_authorized() function
 works correctly with different configurations.
 """
 
+import asyncio
+import functools
+import sys
+import time
 import unittest
+from collections import Counter
 from unittest.mock import patch
 import logging
 
+# Configure logging once per process rather than in every setUp.
+logging.basicConfig(level=logging.WARNING)
+log = logging.getLogger(__name__)
+
+REJECT_LOG_INTERVAL = 5.0  # seconds
+_rejected: Counter = Counter()
+_last_reject_flush = 0.0
+_reject_flush_timer = None
+
+
+def _flush_rejected() -> None:
+    """Log the pending per-user rejection tally as one warning."""
+    global _last_reject_flush, _reject_flush_timer
+    if _reject_flush_timer is not None:
+        _reject_flush_timer.cancel()
+        _reject_flush_timer = None
+    if _rejected:
+        log.warning("Unauthorized Slack messages: %s", dict(_rejected))
+        _rejected.clear()
+    _last_reject_flush = time.monotonic()
+
+
+def _note_unauthorized(user_id: str) -> None:
+    """Mirror of the bridge's note_unauthorized(), called by the dispatcher."""
+    global _reject_flush_timer
+    _rejected[user_id] += 1
+    wait = _last_reject_flush + REJECT_LOG_INTERVAL - time.monotonic()
+    if wait <= 0:
+        _flush_rejected()
+    elif _reject_flush_timer is None:
+        _reject_flush_timer = asyncio.get_running_loop().call_later(
+            wait, _flush_rejected,
+        )
+
+
+def _build_allowlist(raw, default_role: str = "user") -> dict:
+    """Mirror of the bridge's _build_slack_allowlist()."""
+    return {
+        sys.intern(u.strip()): {"role": default_role}
+        for u in raw or ()
+        if u and u.strip()
+    }
+
+
+def _make_authorizer(allowed_users: dict):
+    """Mirror of the is_slack_authorized() closure built by create_slack_app().
+
+    auth_disabled is decided once per allowlist, as the bridge does at startup.
+    """
+    auth_disabled = not allowed_users
+
+    @functools.lru_cache(maxsize=1024)
+    def _authz(user_id: str) -> bool:
+        return auth_disabled or user_id in allowed_users
+
+    def is_authorized(user_id: str) -> bool:
+        return _authz(sys.intern(user_id))
+
+    return is_authorized
+
+
+# (allowed_user_ids, user_id, expected)
+CASES = [
+    # Empty allowlist allows everyone
+    ((), "U12345", True),
+    ((), "UABCDE", True),
+    ((), "", True),
+    # Single allowed user
+    (("U12345",), "U12345", True),
+    (("U12345",), "U67890", False),
+    (("U12345",), "", False),
+    # Multiple allowed users
+    (("U12345", "U67890", "UABCDE"), "UABCDE", True),
+    (("U12345", "U67890", "UABCDE"), "U99999", False),
+    # User IDs are case-sensitive
+    (("U12345",), "u12345", False),
+    # Whitespace around incoming user IDs doesn't match
+    (("U12345",), " U12345", False),
+    (("U12345",), "U12345 ", False),
+    (("U12345",), " U12345 ", False),
+    # Whitespace around allowlist entries is stripped at startup
+    ((" U12345", "U67890 \n"), "U12345", True),
+    ((" U12345", "U67890 \n"), "U67890", True),
+    # Blank entries are dropped; an all-blank allowlist is an empty one
+    (("", "   ", "U12345"), "U12345", True),
+    (("", "   ", "U12345"), "U99999", False),
+    (("", "   "), "U99999", True),
+    # Duplicates in the allowlist are harmless
+    (("U12345", "U12345", "U67890"), "U67890", True),
+    (("U12345", "U12345", "U67890"), "U99999", False),
+    # Real Slack ID formats: standard, workspace (shorter), SlackBot
+    (("U01234ABCDE", "W12345", "USLACKBOT"), "U01234ABCDE", True),
+    (("U01234ABCDE", "W12345", "USLACKBOT"), "W12345", True),
+    (("U01234ABCDE", "W12345", "USLACKBOT"), "USLACKBOT", True),
+]
+
 
 class TestSlackAuthorization(unittest.TestCase):
     """Test Slack user authorization logic."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.log = logging.getLogger(__name__)
-        logging.basicConfig(level=logging.WARNING)
-
-    def test_empty_allowed_users_allows_all(self):
-        """When allowed_user_ids is empty, all users should be authorized."""
-        allowed_users = []
-
-        def is_slack_authorized(user_id: str) -> bool:
-            if not allowed_users:
-                return True
-            if user_id not in allowed_users:
-                self.log.warning("Unauthorized Slack message from user %s", user_id)
-                return False
-            return True
-
-        # Empty list allows everyone
-        self.assertTrue(is_slack_authorized("U12345"))
-        self.assertTrue(is_slack_authorized("U67890"))
-        self.assertTrue(is_slack_authorized("UABCDE"))
-        self.assertTrue(is_slack_authorized(""))
-
-    def test_single_allowed_user(self):
-        """Only the specified user should be authorized."""
-        allowed_users = ["U12345"]
-
-        def is_slack_authorized(user_id: str) -> bool:
-            if not allowed_users:
-                return True
-            if user_id not in allowed_users:
-                self.log.warning("Unauthorized Slack message from user %s", user_id)
-                return False
-            return True
-
-        # Only U12345 is allowed
-        self.assertTrue(is_slack_authorized("U12345"))
-        self.assertFalse(is_slack_authorized("U67890"))
-        self.assertFalse(is_slack_authorized("UABCDE"))
-        self.assertFalse(is_slack_authorized(""))
-
-    def test_multiple_allowed_users(self):
-        """Multiple specified users should be authorized."""
-        allowed_users = ["U12345", "U67890", "UABCDE"]
-
-        def is_slack_authorized(user_id: str) -> bool:
-            if not allowed_users:
-                return True
-            if user_id not in allowed_users:
-                self.log.warning("Unauthorized Slack message from user %s", user_id)
-                return False
-            return True
-
-        # All three users are allowed
-        self.assertTrue(is_slack_authorized("U12345"))
-        self.assertTrue(is_slack_authorized("U67890"))
-        self.assertTrue(is_slack_authorized("UABCDE"))
-
-        # Others are not allowed
-        self.assertFalse(is_slack_authorized("U99999"))
-        self.assertFalse(is_slack_authorized("UOTHER"))
-        self.assertFalse(is_slack_authorized(""))
-
-    def test_case_sensitive_user_ids(self):
-        """User IDs should be case-sensitive."""
-        allowed_users = ["U12345"]
-
-        def is_slack_authorized(user_id: str) -> bool:
-            if not allowed_users:
-                return True
-            if user_id not in allowed_users:
-                self.log.warning("Unauthorized Slack message from user %s", user_id)
-                return False
-            return True
-
-        # Exact match works
-        self.assertTrue(is_slack_authorized("U12345"))
-
-        # Case mismatch fails
-        self.assertFalse(is_slack_authorized("u12345"))
-        self.assertFalse(is_slack_authorized("U12345".lower()))
-
-    @patch('logging.Logger.warning')
-    def test_unauthorized_access_logs_warning(self, mock_warning):
-        """Unauthorized access attempts should log warnings."""
-        allowed_users = ["U12345"]
-
-        def is_slack_authorized(user_id: str) -> bool:
-            if not allowed_users:
-                return True
-            if user_id not in allowed_users:
-                logging.warning("Unauthorized Slack message from user %s", user_id)
-                return False
-            return True
-
-        # Unauthorized user
-        result = is_slack_authorized("U99999")
-        self.assertFalse(result)
-
-        # Warning should have been logged
+    def test_authorization_table(self):
+        """Each (allowlist, user, expected) case from CASES holds."""
+        for allowed, user_id, expected in CASES:
+            is_authorized = _make_authorizer(_build_allowlist(allowed))
+            with self.subTest(allowed=allowed, user_id=user_id):
+                self.assertEqual(is_authorized(user_id), expected)
+
+    def test_allowlist_entries_get_the_default_role(self):
+        """Each allowed user maps to a policy carrying default_role."""
+        self.assertEqual(_build_allowlist(["U12345"]), {"U12345": {"role": "user"}})
+        self.assertEqual(
+            _build_allowlist([" U12345 "], default_role="admin"),
+            {"U12345": {"role": "admin"}},
+        )
+
+    def test_unauthorized_access_logs_warning(self):
+        """Unauthorized access attempts are logged as one aggregated warning."""
+        is_authorized = _make_authorizer(_build_allowlist(["U12345"]))
+
+        async def reject_burst():
+            _flush_rejected()
+            # Unauthorized users, within one rate-limit window; the
+            # dispatcher reports each rejection.
+            for user_id in ("U99999", "U99999", "U88888"):
+                self.assertFalse(is_authorized(user_id))
+                _note_unauthorized(user_id)
+            mock_warning.assert_not_called()
+
+            # Flushing emits a single warning carrying the per-user tally
+            _flush_rejected()
+
+        with patch.object(log, "warning") as mock_warning:
+            asyncio.run(reject_burst())
+
         mock_warning.assert_called_once()
         call_args = str(mock_warning.call_args)
-        self.assertIn("U99999", call_args)
         self.assertIn("Unauthorized", call_args)
+        self.assertIn("'U99999': 2", call_args)
+        self.assertIn("'U88888': 1", call_args)
+
+    def test_trailing_rejections_are_logged_when_window_ends(self):
+        """The last burst is logged even if no further rejection arrives."""
+
+        async def trailing_burst():
+            _flush_rejected()
+            _note_unauthorized("U99999")
+            _note_unauthorized("U99999")
+            mock_warning.assert_not_called()
+            await asyncio.sleep(0.05)
 
-    def test_slack_user_id_formats(self):
-        """Test various Slack user ID formats."""
-        # Real Slack user IDs follow patterns like U01234ABCDE
-        allowed_users = [
-            "U01234ABCDE",  # Standard 11-char format
-            "U05678FGHIJ",  # Another standard
-            "W12345",       # Workspace user ID (shorter)
-            "USLACKBOT",    # SlackBot special ID
-        ]
-
-        def is_slack_authorized(user_id: str) -> bool:
-            if not allowed_users:
-                return True
-            if user_id not in allowed_users:
-                self.log.warning("Unauthorized Slack message from user %s", user_id)
-                return False
-            return True
-
-        # All valid formats should work
-        for user_id in allowed_users:
-            self.assertTrue(is_slack_authorized(user_id),
-                          f"User ID {user_id} should be authorized")
+        with patch(f"{__name__}.REJECT_LOG_INTERVAL", 0.01), \
+                patch.object(log, "warning") as mock_warning:
+            asyncio.run(trailing_burst())
+
+        mock_warning.assert_called_once()
+        self.assertIn("'U99999': 2", str(mock_warning.call_args))
+
+    def test_authorization_check_does_not_log(self):
+        """The check itself is side-effect free; logging is the caller's job."""
+        is_authorized = _make_authorizer(_build_allowlist(["U12345"]))
+        with patch.object(log, "warning") as mock_warning:
+            self.assertFalse(is_authorized("U99999"))
+        mock_warning.assert_not_called()
 
 
 class TestSlackEventHandlers(unittest.TestCase):
@@ -149,16 +186,7 @@ class TestSlackEventHandlers(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.allowed_users = ["U12345", "U67890"]
-
-    def is_slack_authorized(self, user_id: str) -> bool:
-        """Mock authorization function."""
-        if not self.allowed_users:
-            return True
-        if user_id not in self.allowed_users:
-            logging.warning("Unauthorized Slack message from user %s", user_id)
-            return False
-        return True
+        self.is_authorized = _make_authorizer(_build_allowlist(["U12345", "U67890"]))
 
     def test_message_event_authorization(self):
         """Test authorization in message event handler."""
@@ -178,10 +206,10 @@ class TestSlackEventHandlers(unittest.TestCase):
         }
 
         # Authorized user's message should be allowed
-        self.assertTrue(self.is_slack_authorized(authorized_event["user"]))
+        self.assertTrue(self.is_authorized(authorized_event["user"]))
 
         # Unauthorized user's message should be blocked
-        self.assertFalse(self.is_slack_authorized(unauthorized_event["user"]))
+        self.assertFalse(self.is_authorized(unauthorized_event["user"]))
 
     def test_mention_event_authorization(self):
         """Test authorization in app_mention event handler."""
@@ -201,10 +229,10 @@ class TestSlackEventHandlers(unittest.TestCase):
         }
 
         # Authorized user's mention should be allowed
-        self.assertTrue(self.is_slack_authorized(authorized_mention["user"]))
+        self.assertTrue(self.is_authorized(authorized_mention["user"]))
 
         # Unauthorized user's mention should be blocked
-        self.assertFalse(self.is_slack_authorized(unauthorized_mention["user"]))
+        self.assertFalse(self.is_authorized(unauthorized_mention["user"]))
 
     def test_slash_command_authorization(self):
         """Test authorization in slash command handlers."""
@@ -224,89 +252,73 @@ class TestSlackEventHandlers(unittest.TestCase):
         }
 
         # Authorized user's command should be allowed
-        self.assertTrue(self.is_slack_authorized(authorized_command["user_id"]))
+        self.assertTrue(self.is_authorized(authorized_command["user_id"]))
 
         # Unauthorized user's command should be blocked
-        self.assertFalse(self.is_slack_authorized(unauthorized_command["user_id"]))
+        self.assertFalse(self.is_authorized(unauthorized_command["user_id"]))
 
     def test_backward_compatibility_empty_list(self):
         """When allowed_user_ids is empty, all users are allowed."""
-        self.allowed_users = []
+        is_authorized = _make_authorizer(_build_allowlist([]))
 
         # Any user should be allowed when list is empty
-        self.assertTrue(self.is_slack_authorized("U12345"))
-        self.assertTrue(self.is_slack_authorized("U99999"))
-        self.assertTrue(self.is_slack_authorized("ANYONE"))
+        self.assertTrue(is_authorized("U12345"))
+        self.assertTrue(is_authorized("U99999"))
+        self.assertTrue(is_authorized("ANYONE"))
 
 
 class TestSlackAuthorizationEdgeCases(unittest.TestCase):
     """Test edge cases in Slack authorization."""
 
-    def test_empty_user_id(self):
-        """Empty user ID should be rejected when auth is enabled."""
-        allowed_users = ["U12345"]
-
-        def is_slack_authorized(user_id: str) -> bool:
-            if not allowed_users:
-                return True
-            if user_id not in allowed_users:
-                return False
-            return True
-
-        self.assertFalse(is_slack_authorized(""))
-
     def test_none_vs_empty_list(self):
         """None and empty list should behave the same (allow all)."""
         # Python treats empty list as falsy
         self.assertFalse(bool([]))
         self.assertFalse(bool(None))
 
-        # Both should allow all users
-        for allowed_users in [[], None]:
-            def is_slack_authorized(user_id: str) -> bool:
-                if not allowed_users:
-                    return True
-                if user_id not in allowed_users:
-                    return False
-                return True
-
-            self.assertTrue(is_slack_authorized("U12345"))
-            self.assertTrue(is_slack_authorized("U99999"))
-
-    def test_whitespace_in_user_id(self):
-        """User IDs with whitespace should not match."""
-        allowed_users = ["U12345"]
-
-        def is_slack_authorized(user_id: str) -> bool:
-            if not allowed_users:
-                return True
-            if user_id not in allowed_users:
-                return False
-            return True
-
-        # Exact match works
-        self.assertTrue(is_slack_authorized("U12345"))
-
-        # Whitespace variations don't match
-        self.assertFalse(is_slack_authorized(" U12345"))
-        self.assertFalse(is_slack_authorized("U12345 "))
-        self.assertFalse(is_slack_authorized(" U12345 "))
-
-    def test_duplicate_user_ids(self):
-        """Duplicate user IDs in allowed list should still work."""
-        allowed_users = ["U12345", "U12345", "U67890"]
-
-        def is_slack_authorized(user_id: str) -> bool:
-            if not allowed_users:
-                return True
-            if user_id not in allowed_users:
-                return False
-            return True
-
-        # Should work despite duplicates
-        self.assertTrue(is_slack_authorized("U12345"))
-        self.assertTrue(is_slack_authorized("U67890"))
-        self.assertFalse(is_slack_authorized("U99999"))
+        # Both build an empty allowlist, which allows all users
+        for raw in [[], None]:
+            is_authorized = _make_authorizer(_build_allowlist(raw))
+            self.assertTrue(is_authorized("U12345"))
+            self.assertTrue(is_authorized("U99999"))
+
+    def test_disabled_auth_skips_allowlist_lookup(self):
+        """With auth disabled the allowlist is never consulted."""
+
+        class CountingDict(dict):
+            probes = 0
+
+            def __contains__(self, item):
+                CountingDict.probes += 1
+                return super().__contains__(item)
+
+        self.assertTrue(_make_authorizer(CountingDict())("U12345"))
+        self.assertEqual(CountingDict.probes, 0)
+
+    def test_repeat_user_hits_the_cache(self):
+        """Repeat lookups for one user probe the allowlist only once."""
+
+        class CountingDict(dict):
+            probes = 0
+
+            def __contains__(self, item):
+                CountingDict.probes += 1
+                return super().__contains__(item)
+
+        is_authorized = _make_authorizer(CountingDict(_build_allowlist(["U12345"])))
+        for _ in range(10_000):
+            self.assertTrue(is_authorized("U12345"))
+        self.assertEqual(CountingDict.probes, 1)
+
+    def test_interned_allowlist_shares_identity(self):
+        """Interned allowlist entries are the same object as sys.intern(id)."""
+        # Built at runtime so the strings start out as distinct objects.
+        raw = ["".join(("U123", "45")), "".join(("U12", "345 "))]
+        self.assertIsNot(raw[0], raw[1])
+
+        allowed_users = _build_allowlist(raw)
+        self.assertEqual(len(allowed_users), 1)
+        self.assertEqual(id(next(iter(allowed_users))), id(sys.intern("U12345")))
 
 
 if __name__ == "__main__":